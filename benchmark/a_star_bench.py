@@ -0,0 +1,41 @@
+import os
+from time import time
+
+from libgraphy import *
+
+RUNS=5
+SIZES=[10, 20, 30, 40, 50, 60]
+
+def lg_bench(g: Graph, h: Heuristic, algorithm: AlgorithmEnum) -> tuple[float, int]:
+    s, t = g.vertices[0], g.vertices[-1]
+
+    start = time()
+    path: Path = g.find_path(s, t, h, algorithm)
+    end = time()
+
+    return end - start, path.settled
+
+os.makedirs("res/a_star", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    times = []
+    for n in SIZES:
+        print("vertices:", n * n)
+        # All edges kept, so the grid is connected
+        g: Graph = GraphFactory.square_grid(n, n, 4 * n * n, diagonals=False)
+
+        dj_tm, dj_settled = lg_bench(g, Heuristic(), AlgorithmEnum.DIJKSTRA)
+        df_tm, df_settled = lg_bench(g, Heuristic(), AlgorithmEnum.A_STAR)
+        md_tm, md_settled = lg_bench(g, ManhattanDistance(), AlgorithmEnum.A_STAR)
+        lm_tm, lm_settled = lg_bench(g, LandmarkHeuristic(g), AlgorithmEnum.A_STAR)
+
+        print(len(g.edges), dj_tm, dj_settled, df_tm, df_settled, md_tm, md_settled, lm_tm, lm_settled)
+        times.append([n * n, len(g.edges), dj_tm, dj_settled, df_tm, df_settled, md_tm, md_settled, lm_tm, lm_settled])
+
+    print("Saving to file...")
+    with open(f"res/a_star/a_star_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
@@ -0,0 +1,93 @@
+import os
+from random import seed
+from time import time
+from typing import Dict, Optional
+
+from libgraphy import *
+from libgraphy.algorithm import _Algorithm
+
+INFINITY = float("inf")
+
+RUNS=5
+SIZES=[100, 200, 400, 800, 1600]
+EDGES_PER_VERTEX=4
+
+def bellman_ford_passes_tree(graph: Graph, start: Vertex) -> ShortestPathTree:
+    # Classic V-1 passes over every edge, the reference for the SPFA-based BELLMAN_FORD
+    # https://gist.github.com/ngenator/6178728
+    # Dictionary of each vertex's distance from start
+    distance_from_start: Dict[Vertex, float] = {
+        vertex: (0 if vertex == start else INFINITY) for vertex in graph.vertices
+    }
+    # Visited edge to reach vertex
+    previous_edge: Dict[Vertex, Optional[Edge]] = {vertex: None for vertex in graph.vertices}
+
+    for _ in range(len(graph.vertices) - 1):
+        for e in graph.edges:
+            p: Vertex = e.predecessor
+            s: Vertex = e.successor
+
+            if distance_from_start[p] == INFINITY:
+                continue
+
+            new_path: float = distance_from_start[p] + e.value
+            if new_path < distance_from_start[s]:
+                distance_from_start[s] = new_path
+                previous_edge[s] = e
+
+    for e in graph.edges:
+        p: Vertex = e.predecessor
+        s: Vertex = e.successor
+
+        new_path: float = distance_from_start[p] + e.value
+        if new_path < distance_from_start[s]:
+            raise LibgraphyError("Negative cycle found!")
+
+    return ShortestPathTree(graph, start, distance_from_start, previous_edge)
+
+def lg_bench(tree_algorithm, g: Graph) -> float:
+    start = time()
+    try:
+        tree_algorithm(g, g.vertices[0])
+    except LibgraphyError: # negative cycle
+        pass
+    end = time()
+
+    return end - start
+
+def lg_numpy_bench(g: Graph) -> float:
+    start = time()
+    try:
+        g.find_path(g.vertices[0], g.vertices[-1], algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+    except LibgraphyError: # negative cycle
+        pass
+    end = time()
+
+    return end - start
+
+os.makedirs("res/bellman_ford", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    seed(i)
+    times = []
+    for n in SIZES:
+        print("vertices:", n)
+        g: Graph = GraphFactory.digraph(n, EDGES_PER_VERTEX * n, weighted=True)
+        # Some negated weights, small enough to rarely close a negative cycle
+        for e in g.edges[::10]:
+            e.value = -e.value / 10
+
+        passes_tm = lg_bench(bellman_ford_passes_tree, g)
+        spfa_tm = lg_bench(_Algorithm.bellman_ford_tree, g)
+        numpy_tm = lg_numpy_bench(g)
+
+        print(len(g.edges), passes_tm, spfa_tm, numpy_tm)
+        times.append([n, len(g.edges), passes_tm, spfa_tm, numpy_tm])
+
+    print("Saving to file...")
+    with open(f"res/bellman_ford/bellman_ford_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
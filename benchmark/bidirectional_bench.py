@@ -0,0 +1,58 @@
+import json
+import os
+from time import time
+
+from libgraphy import *
+
+RUNS=10
+
+def lg_create_graph(n: int, edges: list) -> Graph:
+    g = Graph()
+
+    for i in range(n):
+        g += Vertex(i)
+
+    for e in edges:
+        g += Edge(g.vertices[e[0]], g.vertices[e[1]], e[2])
+
+    return g
+
+def lg_bench(g: Graph, s, t, algorithm: AlgorithmEnum) -> tuple[float, int]:
+    s, t = g.vertices[s], g.vertices[t]
+
+    start = time()
+    path: Path = g.find_path(s, t, algorithm = algorithm)
+    end = time()
+
+    return end - start, path.settled
+
+os.makedirs("res/bidirectional", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    times = []
+    with open("generated/dijkstra_edges.txt") as f:
+        n = 10
+        for l in f:
+            edges, vertices, hops = json.loads(l)
+            s, t = vertices
+            print("vertices:", n)
+
+            lg_g = lg_create_graph(n, edges)
+            # Build the reverse adjacency index outside of the timed query
+            lg_g.edges._incoming(lg_g.vertices[t])
+
+            dj_tm, dj_settled = lg_bench(lg_g, s, t, AlgorithmEnum.DIJKSTRA)
+            bd_tm, bd_settled = lg_bench(lg_g, s, t, AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA)
+
+            print(len(edges), dj_tm, dj_settled, bd_tm, bd_settled)
+            times.append([len(edges), hops, dj_tm, dj_settled, bd_tm, bd_settled])
+
+            n += 10
+
+    print("Saving to file...")
+    with open(f"res/bidirectional/bidirectional_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
@@ -0,0 +1,48 @@
+import os
+from random import seed, randint, choice
+from time import time
+
+from libgraphy import *
+
+RUNS=5
+SIZES=[10, 20, 30, 40, 50]
+QUERIES=100
+
+def lg_bench(g: Graph, pairs: list[tuple[Vertex, Vertex]], algorithm: AlgorithmEnum) -> float:
+    start = time()
+    for s, t in pairs:
+        g.find_path(s, t, algorithm = algorithm)
+    end = time()
+
+    return (end - start) / len(pairs)
+
+os.makedirs("res/ch", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    seed(i)
+    times = []
+    for n in SIZES:
+        print("vertices:", n * n)
+        # All edges kept, so the grid is connected
+        g: Graph = GraphFactory.square_grid(n, n, 4 * n * n, diagonals=False)
+        for e in g.edges:
+            e.value = randint(1, 100)
+        pairs = [(choice(g.vertices), choice(g.vertices)) for _ in range(QUERIES)]
+
+        start = time()
+        ch: ContractionHierarchy = g.preprocess_ch()
+        preprocess_tm = time() - start
+
+        dj_tm = lg_bench(g, pairs, AlgorithmEnum.DIJKSTRA)
+        ch_tm = lg_bench(g, pairs, AlgorithmEnum.CH)
+
+        print(len(g.edges), ch.shortcuts(), preprocess_tm, dj_tm, ch_tm)
+        times.append([n * n, len(g.edges), ch.shortcuts(), preprocess_tm, dj_tm, ch_tm])
+
+    print("Saving to file...")
+    with open(f"res/ch/ch_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
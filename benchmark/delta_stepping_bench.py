@@ -0,0 +1,41 @@
+import os
+from time import time
+
+from libgraphy import *
+
+RUNS=5
+SIZES=[500, 1000, 2000, 4000]
+
+def lg_bench(fg: FrozenGraph, s: Vertex, algorithm: AlgorithmEnum) -> float:
+    start = time()
+    if algorithm == AlgorithmEnum.DELTA_STEPPING:
+        fg.delta_stepping(s)
+    else:
+        fg.graph.shortest_path_tree(s, algorithm)
+    end = time()
+
+    return end - start
+
+os.makedirs("res/delta_stepping", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    times = []
+    for n in SIZES:
+        print("vertices:", n)
+        g: Graph = GraphFactory.digraph(n, 8 * n, weighted=True)
+        fg: FrozenGraph = g.freeze()
+        s = g.vertices[0]
+
+        ds_tm = lg_bench(fg, s, AlgorithmEnum.DELTA_STEPPING)
+        dj_tm = lg_bench(fg, s, AlgorithmEnum.DIJKSTRA)
+
+        print(fg.delta(), ds_tm, dj_tm)
+        times.append([n, fg.delta(), ds_tm, dj_tm])
+
+    print("Saving to file...")
+    with open(f"res/delta_stepping/delta_stepping_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
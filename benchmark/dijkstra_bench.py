@@ -49,6 +49,15 @@ def lg_bench(g: Graph, s, t) -> float:
 
     return end - start
 
+def lg_frozen_bench(g: FrozenGraph, s, t) -> float:
+    s, t = g.vertices[s], g.vertices[t]
+
+    start = time()
+    g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+    end = time()
+
+    return end - start
+
 def nx_bench(g: nx.DiGraph, s, t) -> float:
     start = time()
     nx.dijkstra_path(g, s, t)
@@ -74,15 +83,17 @@ for i in range(RUNS):
             print("vertices:", n)
 
             lg_g = lg_create_graph(n, edges)
+            lg_fg = lg_g.freeze()
             nx_g = nx_create_graph(n, edges)
             scg_g = scg_create_graph(n, edges)
 
             lg_tm = lg_bench(lg_g, s, t)
             nx_tm = nx_bench(nx_g, s, t)
             scg_tm = scg_bench(scg_g, s)
+            lg_fg_tm = lg_frozen_bench(lg_fg, s, t)
 
-            print(len(edges), lg_tm, nx_tm, scg_tm)
-            times.append([len(edges), hops, lg_tm, nx_tm, scg_tm])
+            print(len(edges), lg_tm, nx_tm, scg_tm, lg_fg_tm)
+            times.append([len(edges), hops, lg_tm, nx_tm, scg_tm, lg_fg_tm])
 
             n += 10
 
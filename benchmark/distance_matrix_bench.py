@@ -0,0 +1,52 @@
+import os
+from random import seed, randint
+from time import time
+
+from libgraphy import *
+
+RUNS=5
+SIZES=[100, 200, 400, 800]
+EDGES_PER_VERTEX=4
+QUERIES=20
+
+def lg_find_path_bench(g: Graph, sources: list[Vertex], targets: list[Vertex]) -> float:
+    start = time()
+    for s in sources:
+        for t in targets:
+            g.find_path(s, t)
+    end = time()
+
+    return end - start
+
+def lg_distance_matrix_bench(g: Graph, sources: list[Vertex], targets: list[Vertex]) -> float:
+    start = time()
+    g.distance_matrix(sources, targets)
+    end = time()
+
+    return end - start
+
+os.makedirs("res/distance_matrix", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    seed(i)
+    times = []
+    for n in SIZES:
+        print("vertices:", n)
+        g: Graph = GraphFactory.digraph(n, EDGES_PER_VERTEX * n)
+        for e in g.edges:
+            e.value = randint(1, 100)
+        sources, targets = g.vertices[:QUERIES], g.vertices[-QUERIES:]
+
+        find_path_tm = lg_find_path_bench(g, sources, targets)
+        distance_matrix_tm = lg_distance_matrix_bench(g, sources, targets)
+
+        print(len(g.edges), find_path_tm, distance_matrix_tm)
+        times.append([n, len(g.edges), find_path_tm, distance_matrix_tm])
+
+    print("Saving to file...")
+    with open(f"res/distance_matrix/distance_matrix_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
@@ -0,0 +1,48 @@
+import os
+import tracemalloc
+from time import time
+
+from libgraphy import *
+
+RUNS=5
+SIZES=[20, 40, 60, 80, 100]
+
+def lg_bench(g: Graph | ImplicitGridGraph, s: Vertex, t: Vertex, algorithm: AlgorithmEnum) -> tuple[float, int]:
+    start = time()
+    path: Path = g.find_path(s, t, ChebyshevDistance(), algorithm)
+    end = time()
+
+    return end - start, path.settled
+
+def lg_memory(create) -> tuple[object, int]:
+    tracemalloc.start()
+    g = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return g, size
+
+os.makedirs("res/implicit_grid", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    times = []
+    for n in SIZES:
+        print("vertices:", n * n)
+        # Same 8-connected grid with every edge, materialized or not
+        g, g_bytes = lg_memory(lambda: GraphFactory.square_grid(n, n, 8 * n * n, diagonals=True))
+        ig, ig_bytes = lg_memory(lambda: ImplicitGridGraph(n, n, diagonals=True))
+
+        g_tm, g_settled = lg_bench(g, g.vertices[0], g.vertices[-1], AlgorithmEnum.A_STAR)
+        ig_tm, ig_settled = lg_bench(ig, ig.vertex(0, 0), ig.vertex(n - 1, n - 1), AlgorithmEnum.A_STAR)
+        jps_tm, jps_settled = lg_bench(ig, ig.vertex(0, 0), ig.vertex(n - 1, n - 1), AlgorithmEnum.JPS)
+
+        print(g_bytes, ig_bytes, g_tm, g_settled, ig_tm, ig_settled, jps_tm, jps_settled)
+        times.append([n * n, g_bytes, ig_bytes, g_tm, g_settled, ig_tm, ig_settled, jps_tm, jps_settled])
+
+    print("Saving to file...")
+    with open(f"res/implicit_grid/implicit_grid_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
@@ -0,0 +1,51 @@
+import os
+from random import seed, randint
+from time import time
+
+from libgraphy import *
+from libgraphy.algorithm import _Algorithm
+
+RUNS=5
+SIZES=[250, 500, 1000, 2000, 4000]
+EDGES_PER_VERTEX=4
+
+def lg_bench(tree_algorithm, g: Graph) -> float:
+    start = time()
+    tree_algorithm(g, g.vertices[0])
+    end = time()
+
+    return end - start
+
+os.makedirs("res/integer_weights", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    seed(i)
+    times = []
+    for n in SIZES:
+        print("vertices:", n)
+        g: Graph = GraphFactory.digraph(n, EDGES_PER_VERTEX * n)
+
+        # 0/1 penalties
+        for e in g.edges:
+            e.value = randint(0, 1)
+        g.traits().max_weight
+        dijkstra_01_tm = lg_bench(_Algorithm.dijkstra_tree, g)
+        zero_one_bfs_tm = lg_bench(_Algorithm.zero_one_bfs_tree, g)
+
+        # 1-100 costs, as in generate_dijkstra_graphs.py
+        for e in g.edges:
+            e.value = randint(1, 100)
+        g.traits().max_weight
+        dijkstra_tm = lg_bench(_Algorithm.dijkstra_tree, g)
+        dial_tm = lg_bench(_Algorithm.dial_tree, g)
+
+        print(len(g.edges), dijkstra_01_tm, zero_one_bfs_tm, dijkstra_tm, dial_tm)
+        times.append([n, len(g.edges), dijkstra_01_tm, zero_one_bfs_tm, dijkstra_tm, dial_tm])
+
+    print("Saving to file...")
+    with open(f"res/integer_weights/integer_weights_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
@@ -0,0 +1,47 @@
+import os
+from time import time
+
+from libgraphy import *
+
+RUNS=5
+SIZES=[10, 20, 30, 40, 50, 60]
+
+def lg_bench(g: Graph, h: Heuristic, algorithm: AlgorithmEnum) -> tuple[float, int]:
+    s, t = g.vertices[0], g.vertices[-1]
+
+    start = time()
+    path: Path = g.find_path(s, t, h, algorithm)
+    end = time()
+
+    return end - start, path.settled
+
+os.makedirs("res/jps", exist_ok=True)
+
+for i in range(RUNS):
+    print(f"*** ITERATION {i} ***")
+    times = []
+    for n in SIZES:
+        print("vertices:", n * n)
+        # 8-connected grid with every edge, then a wall across the middle column
+        # with a gap on the last row, cut in both directions
+        g: Graph = GraphFactory.square_grid(n, n, 8 * n * n, diagonals=True)
+        for v in g.vertices:
+            if v.x == n // 2 and v.y < n - 1:
+                for u in [* v.neighbors]:
+                    del v[v.neighbors.index(u)]
+                    del u[u.neighbors.index(v)]
+
+        # The grid is built on the first JPS query, time it apart
+        grid_tm, _ = lg_bench(g, Heuristic(), AlgorithmEnum.JPS)
+        jps_tm, jps_settled = lg_bench(g, Heuristic(), AlgorithmEnum.JPS)
+        cd_tm, cd_settled = lg_bench(g, ChebyshevDistance(), AlgorithmEnum.A_STAR)
+
+        print(len(g.edges), grid_tm, jps_tm, jps_settled, cd_tm, cd_settled)
+        times.append([n * n, len(g.edges), grid_tm, jps_tm, jps_settled, cd_tm, cd_settled])
+
+    print("Saving to file...")
+    with open(f"res/jps/jps_times_{i}.txt", 'w+') as f:
+        for t in times:
+            f.write(f'{t}\n')
+
+print("Done.")
@@ -23,7 +23,7 @@ def create_lists() -> list:
 
     with open(fname) as f:
         for l in f:
-            _, _, lg_tm, nx_tm, scg_tm = json.loads(l)
+            _, _, lg_tm, nx_tm, scg_tm = json.loads(l)[:5]
 
             lg_times.append(lg_tm)
             nx_times.append(nx_tm)
@@ -37,7 +37,7 @@ def average_all_runs(lg_times: list, nx_times: list, scg_times: list):
         with open(f'res/dijkstra/dijkstra_times_{i}.txt') as f:
             k = 0
             for l in f:
-                _, _, lg_tm, nx_tm, scg_tm = json.loads(l)
+                _, _, lg_tm, nx_tm, scg_tm = json.loads(l)[:5]
 
                 lg_times[k] += lg_tm
                 nx_times[k] += nx_tm
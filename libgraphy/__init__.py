@@ -1,6 +1,10 @@
 from .vertex import *
 from .edge import *
 from .graph import *
+from .frozengraph import *
+from .allpairs import *
+from .contraction import *
+from .implicitgrid import *
 from .algorithm import *
 from .heuristic import *
 from .path import *
@@ -8,4 +12,4 @@ from .exception import *
 from .graphfactory import *
 from .edgeset import *
 
-__all__ = ["Vertex", "Edge", "EdgeSet", "Graph", "Path", "LibgraphyException", "LibgraphyError", "GraphFactory", "AlgorithmEnum", "Heuristic"]
\ No newline at end of file
+__all__ = ["Vertex", "Edge", "EdgeSet", "Graph", "FrozenGraph", "Path", "LibgraphyException", "LibgraphyError", "GraphFactory", "AlgorithmEnum", "ShortestPathTree", "AllPairsShortestPaths", "ContractionHierarchy", "ImplicitGridGraph", "Heuristic", "ManhattanDistance", "HexagonalManhattanDistance", "ChebyshevDistance", "LandmarkHeuristic", "LandmarkSelection"]
\ No newline at end of file
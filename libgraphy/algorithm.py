@@ -1,190 +1,223 @@
 from __future__ import annotations
 
-__all__ = ["_Algorithm", "_AlgorithmFunction", "AlgorithmEnum"]
+__all__ = ["_Algorithm", "_AlgorithmFunction", "_TreeAlgorithmFunction", "AlgorithmEnum", "ShortestPathTree"]
 
-from typing import TYPE_CHECKING, Deque, Optional, Callable, Dict
+from typing import TYPE_CHECKING, Deque, Iterable, Optional, Callable, Dict
 if TYPE_CHECKING: # pragma: no cover
     from .vertex import Vertex
     from .graph import Graph
     from .edge import Edge
-    from .heuristic import Heuristic
+    from .frozengraph import FrozenGraph
 
 from enum import Enum, auto
-from .exception import LibgraphyError
 
 from .path import Path
+from .heuristic import Heuristic
 
-from collections import deque 
+from collections import deque
 
 type _AlgorithmFunction = Callable[[Graph, Vertex, Vertex, Heuristic], Path]
+type _TreeAlgorithmFunction = Callable[[Graph, Vertex, Optional[Vertex], Optional[Iterable[Vertex]]], ShortestPathTree]
 
 INFINITY = float("inf")
 
+# Largest edge value BEST hands to Dial's algorithm, one bucket per value
+DIAL_MAX_WEIGHT = 256
+
 class AlgorithmEnum(Enum):
     DIJKSTRA = auto()
     BELLMAN_FORD = auto()
     A_STAR = auto()
     BEST = auto()
-
-class _Algorithm:
-    @staticmethod
-    def dijkstra(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
-        # Taken and tweaked form of the following code:
-        # https://github.com/dmahugh/dijkstra-algorithm/blob/master/dijkstra_algorithm.py
-        unvisited_vertices: list[Vertex] = [* graph.vertices]  # All vertices are initially unvisited
-
-        # Dictionary of each vertex's distance from start
-        distance_from_start: Dict[Vertex, float] = {
-            vertex: (0 if vertex == start else INFINITY) for vertex in graph.vertices
-        }
-
-        # Visited edge to reach vertex
-        previous_edge: Dict[Vertex, Optional[Edge]] = {vertex: None for vertex in graph.vertices}
-
-        while unvisited_vertices:
-            current_vertex: Vertex = min(
-                    unvisited_vertices, key=lambda vertex: distance_from_start[vertex]
-                )
-            unvisited_vertices.remove(current_vertex)
-
-            if distance_from_start[current_vertex] == INFINITY:
-                break
-
-            for e in current_vertex.adjacent_edges:
-                s: Vertex = e.successor
-
-                new_path: float = distance_from_start[current_vertex] + e.value
-                if new_path < distance_from_start[s]:
-                    distance_from_start[s] = new_path
-                    previous_edge[s] = e
-
-            if current_vertex == end:
-                break # Visited the destination vertex, finish
-
-        path: Path = Path(graph)
+    BIDIRECTIONAL_DIJKSTRA = auto()
+    BELLMAN_FORD_NUMPY = auto()
+    BFS = auto()
+    ZERO_ONE_BFS = auto()
+    DIAL = auto()
+    DAG = auto()
+    JOHNSON = auto()
+    FLOYD_WARSHALL = auto()
+    CH = auto()
+    JPS = auto()
+    DELTA_STEPPING = auto()
+
+class ShortestPathTree:
+    """Distances and predecessor edges from a single start vertex.
+
+    Paths to any number of targets are read from the tree without searching again.
+    """
+
+    def __init__(self, graph: Graph, start: Vertex, distance_from_start: Dict[Vertex, float], previous_edge: Dict[Vertex, Optional[Edge]], settled: Optional[int] = None) -> None:
+        self.graph: Graph = graph
+        self.start: Vertex = start
+        # Missing vertices are unreachable from start
+        self.distance_from_start: Dict[Vertex, float] = distance_from_start
+        self.previous_edge: Dict[Vertex, Optional[Edge]] = previous_edge
+        self.settled: Optional[int] = settled
+
+    def __contains__(self, end: Vertex) -> bool:
+        return self.distance(end) != INFINITY
+
+    def distance(self, end: Vertex) -> float:
+        return self.distance_from_start.get(end, INFINITY)
+
+    def path_to(self, end: Vertex) -> Path:
+        path: Path = Path(self.graph)
         queue: Deque = deque()
-        current_vertex: Vertex = end
 
-        pe: Optional[Edge] = previous_edge[current_vertex]
+        pe: Optional[Edge] = self.previous_edge.get(end)
         while pe is not None:
             queue.appendleft(pe)
-            current_vertex = pe.predecessor
-            pe = previous_edge[current_vertex]
+            pe = self.previous_edge.get(pe.predecessor)
 
         path.edges = list(queue)
-        path.value = distance_from_start[end]
+        path.value = self.distance(end)
+        path.settled = self.settled
 
         return path
 
+class _Algorithm:
+    # Every engine runs on the CSR snapshot of the graph, rebuilt after each
+    # change to it; see _FrozenAlgorithm.
+
     @staticmethod
-    def bellman_ford(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
-        # https://gist.github.com/ngenator/6178728
-        # Dictionary of each vertex's distance from start
-        distance_from_start: Dict[Vertex, float] = {
-            vertex: (0 if vertex == start else INFINITY) for vertex in graph.vertices
-        }
-        # Visited edge to reach vertex
-        previous_edge: Dict[Vertex, Optional[Edge]] = {vertex: None for vertex in graph.vertices}
-
-        for _ in range(len(graph.vertices) - 1):
-            for e in graph.edges:
-                p: Vertex = e.predecessor
-                s: Vertex = e.successor
-
-                if distance_from_start[p] == INFINITY:
-                    continue
-
-                new_path: float = distance_from_start[p] + e.value
-                if new_path < distance_from_start[s]:
-                    distance_from_start[s] = new_path
-                    previous_edge[s] = e
-
-        for e in graph.edges:
-            p: Vertex = e.predecessor
-            s: Vertex = e.successor
-
-            new_path: float = distance_from_start[p] + e.value
-            if new_path < distance_from_start[s]:
-                raise LibgraphyError("Negative cycle found!")
-
-        path: Path = Path(graph)
-        queue: Deque = deque()
-        current_vertex: Vertex = end
+    def _remaining(end: Optional[Vertex], targets: Optional[Iterable[Vertex]]) -> Optional[set[Vertex]]:
+        # Vertices still to settle before a search may stop, None to search everything
+        if targets is not None:
+            return set(targets)
+        return {end} if end is not None else None
 
-        pe: Optional[Edge] = previous_edge[current_vertex]
-        while pe is not None:
-            queue.appendleft(pe)
-            current_vertex = pe.predecessor
-            pe = previous_edge[current_vertex]
+    @staticmethod
+    def _tree(graph: Graph, algorithm: AlgorithmEnum, start: Vertex, end: Optional[Vertex], targets: Optional[Iterable[Vertex]]) -> ShortestPathTree:
+        return graph._frozen().shortest_path_tree(start, algorithm, _Algorithm._remaining(end, targets))
 
-        path.edges = list(queue)
-        path.value = distance_from_start[end]
+    @staticmethod
+    def _path(graph: Graph, algorithm: AlgorithmEnum, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return graph._frozen().find_path(start, end, h, algorithm)
 
-        return path
+    @staticmethod
+    def dijkstra_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.DIJKSTRA, start, end, targets)
 
     @staticmethod
-    def a_star(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
-        unvisited_vertices: list[Vertex] = [* graph.vertices]  # All vertices are initially unvisited
+    def dijkstra(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.DIJKSTRA, start, end, h)
 
-        # Dictionary of each vertex's distance from start
-        distance_from_start: Dict[Vertex, float] = {
-            vertex: (0 if vertex == start else INFINITY) for vertex in graph.vertices
-        }
+    @staticmethod
+    def bfs_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.BFS, start, end, targets)
 
-        hcost: Dict[Vertex, float] = {
-            vertex: distance_from_start[vertex] + h.evaluate(vertex, end, graph) for vertex in graph.vertices
-        }
+    @staticmethod
+    def bfs(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.BFS, start, end, h)
 
-        # Visited edge to reach vertex
-        previous_edge: Dict[Vertex, Optional[Edge]] = {vertex: None for vertex in graph.vertices}
+    @staticmethod
+    def zero_one_bfs_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.ZERO_ONE_BFS, start, end, targets)
 
-        while unvisited_vertices:
-            current_vertex: Vertex = min(
-                    unvisited_vertices, key=lambda vertex: hcost[vertex]
-                )
-            unvisited_vertices.remove(current_vertex)
+    @staticmethod
+    def zero_one_bfs(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.ZERO_ONE_BFS, start, end, h)
 
-            if distance_from_start[current_vertex] == INFINITY:
-                continue
+    @staticmethod
+    def dial_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.DIAL, start, end, targets)
 
-            for e in current_vertex.adjacent_edges:
-                s: Vertex = e.successor
+    @staticmethod
+    def dial(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.DIAL, start, end, h)
 
-                new_path: float = distance_from_start[current_vertex] + e.value
+    @staticmethod
+    def dag_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.DAG, start, end, targets)
 
-                if new_path < distance_from_start[s]:
-                    distance_from_start[s] = new_path
-                    previous_edge[s] = e
-                    hcost[s] = distance_from_start[s] + h.evaluate(s, end, graph)
+    @staticmethod
+    def dag(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.DAG, start, end, h)
 
-            # if current_vertex == end:
-            #     break # Visited the destination vertex, finish
+    @staticmethod
+    def bellman_ford_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.BELLMAN_FORD, start, end, targets)
 
-        path: Path = Path(graph)
-        queue: Deque = deque()
-        current_vertex: Vertex = end
+    @staticmethod
+    def bellman_ford(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.BELLMAN_FORD, start, end, h)
 
-        pe: Optional[Edge] = previous_edge[current_vertex]
-        while pe is not None:
-            queue.appendleft(pe)
-            current_vertex = pe.predecessor
-            pe = previous_edge[current_vertex]
+    @staticmethod
+    def bellman_ford_numpy(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.BELLMAN_FORD_NUMPY, start, end, h)
 
-        path.edges = list(queue)
-        path.value = distance_from_start[end]
+    @staticmethod
+    def delta_stepping_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm._tree(graph, AlgorithmEnum.DELTA_STEPPING, start, end, targets)
 
-        return path
+    @staticmethod
+    def delta_stepping(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.DELTA_STEPPING, start, end, h)
 
     @staticmethod
-    def best(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
-        gt: Graph.Traits = graph.traits()
+    def a_star(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.A_STAR, start, end, h)
+
+    @staticmethod
+    def bidirectional_dijkstra(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        return _Algorithm._path(graph, AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA, start, end, h)
+
+    @staticmethod
+    def ch(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        # Bidirectional upward search in the graph's contraction hierarchy,
+        # preprocessed on first use and after every change to the graph
+        return graph.preprocess_ch().find_path(start, end)
+
+    @staticmethod
+    def jps(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        # Jump point search on the grid laid out by the vertex coordinates,
+        # guided by the grid's own distance estimate rather than h
+        return _Algorithm._path(graph, AlgorithmEnum.JPS, start, end, h)
 
-        if gt.is_grid is True:
-            print("ASTAR")
-            return _Algorithm.a_star(graph, start, end, h)
+    @staticmethod
+    def best_algorithm(gt: Graph.Traits | FrozenGraph.Traits, h: Optional[Heuristic] = None) -> AlgorithmEnum:
+        # Choice of BEST for Graph and FrozenGraph alike, A* only when a heuristic is given
+        if gt.is_weighted is False:
+            # A heuristic only pays off on grids
+            if h is not None and type(h) is not Heuristic and gt.is_grid is True:
+                return AlgorithmEnum.A_STAR
+            return AlgorithmEnum.BFS
+        elif gt.has_cycles is False:
+            return AlgorithmEnum.DAG
         elif gt.has_negative_edges is True:
-            return _Algorithm.bellman_ford(graph, start, end, h)
+            return AlgorithmEnum.BELLMAN_FORD
+        elif gt.has_integer_weights is True and gt.max_weight <= 1:
+            return AlgorithmEnum.ZERO_ONE_BFS
+        elif gt.has_integer_weights is True and gt.max_weight <= DIAL_MAX_WEIGHT:
+            return AlgorithmEnum.DIAL
         else:
-            return _Algorithm.dijkstra(graph, start, end, h)
+            return AlgorithmEnum.DIJKSTRA
 
+    @staticmethod
+    def best(graph: Graph, start: Vertex, end: Vertex, h: Heuristic) -> Path:
+        path_algorithm: _AlgorithmFunction = {
+            AlgorithmEnum.A_STAR: _Algorithm.a_star,
+            AlgorithmEnum.BFS: _Algorithm.bfs,
+            AlgorithmEnum.DAG: _Algorithm.dag,
+            AlgorithmEnum.BELLMAN_FORD: _Algorithm.bellman_ford,
+            AlgorithmEnum.ZERO_ONE_BFS: _Algorithm.zero_one_bfs,
+            AlgorithmEnum.DIAL: _Algorithm.dial,
+            AlgorithmEnum.DIJKSTRA: _Algorithm.dijkstra
+        }[_Algorithm.best_algorithm(graph.traits(), h)]
+        return path_algorithm(graph, start, end, h)
 
+    @staticmethod
+    def best_tree_algorithm(graph: Graph) -> _TreeAlgorithmFunction:
+        return {
+            AlgorithmEnum.BFS: _Algorithm.bfs_tree,
+            AlgorithmEnum.DAG: _Algorithm.dag_tree,
+            AlgorithmEnum.BELLMAN_FORD: _Algorithm.bellman_ford_tree,
+            AlgorithmEnum.ZERO_ONE_BFS: _Algorithm.zero_one_bfs_tree,
+            AlgorithmEnum.DIAL: _Algorithm.dial_tree,
+            AlgorithmEnum.DIJKSTRA: _Algorithm.dijkstra_tree
+        }[_Algorithm.best_algorithm(graph.traits())]
+
+    @staticmethod
+    def best_tree(graph: Graph, start: Vertex, end: Optional[Vertex] = None, targets: Optional[Iterable[Vertex]] = None) -> ShortestPathTree:
+        return _Algorithm.best_tree_algorithm(graph)(graph, start, end, targets)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+__all__ = ["AllPairsShortestPaths", "_AllPairs"]
+
+from typing import TYPE_CHECKING, Deque, Dict, Optional
+if TYPE_CHECKING: # pragma: no cover
+    from .graph import Graph
+    from .vertex import Vertex
+    from .edge import Edge
+    from .frozengraph import FrozenGraph
+
+from collections import deque
+from heapq import heappush, heappop
+
+from .exception import LibgraphyError
+from .path import Path
+
+try:
+    import numpy as np
+    numpy_found = True
+except ImportError:
+    numpy_found = False
+
+INFINITY = float("inf")
+
+# Edge density (E / V(V-1)) from which BEST picks Floyd-Warshall over Johnson.
+# Vectorized rounds make Floyd-Warshall win on all but quite sparse graphs.
+FLOYD_WARSHALL_MIN_DENSITY = 0.01
+
+class AllPairsShortestPaths:
+    """Shortest distances between every pair of vertices of a graph.
+
+    distances[i, j] is the distance from the i-th to the j-th vertex (infinity
+    if unreachable) and successors[i, j] the position of the vertex after the
+    i-th one on that path, -1 if there is none. Positions follow graph.vertices
+    at the time of the computation.
+    """
+
+    def __init__(self, graph: Graph, vertices: list[Vertex], distances: np.ndarray, successors: np.ndarray) -> None:
+        self.graph: Graph = graph
+        self.vertices: list[Vertex] = vertices
+        self.indices: Dict[Vertex, int] = {v: i for i, v in enumerate(vertices)}
+        self.distances: np.ndarray = distances
+        self.successors: np.ndarray = successors
+
+    def index(self, vertex: Vertex) -> int:
+        i = self.indices.get(vertex)
+        if i is None:
+            raise LibgraphyError(f"Vertex {vertex} does not belong to the graph")
+        return i
+
+    def distance(self, start: Vertex, end: Vertex) -> float:
+        return float(self.distances[self.index(start), self.index(end)])
+
+    def path(self, start: Vertex, end: Vertex) -> Path:
+        i, j = self.index(start), self.index(end)
+
+        path: Path = Path(self.graph)
+        path.value = float(self.distances[i, j])
+
+        while i != j and self.successors[i, j] >= 0:
+            u: Vertex = self.vertices[i]
+            i = int(self.successors[i, j])
+            v: Vertex = self.vertices[i]
+            # Parallel edges: the path goes through the cheapest one
+            path.edges.append(min((e for e in u.adjacent_edges if e.successor is v), key=lambda e: e.value))
+
+        return path
+
+class _AllPairs:
+    @staticmethod
+    def best(fg: FrozenGraph) -> AllPairsShortestPaths:
+        n: int = len(fg)
+        if n > 1 and len(fg.targets) / (n * (n - 1)) >= FLOYD_WARSHALL_MIN_DENSITY:
+            return _AllPairs.floyd_warshall(fg)
+        return _AllPairs.johnson(fg)
+
+    @staticmethod
+    def floyd_warshall(fg: FrozenGraph) -> AllPairsShortestPaths:
+        if not numpy_found:
+            raise ImportError("No NumPy found!")
+
+        n: int = len(fg)
+        successors_csr = np.frombuffer(fg.targets, dtype=np.int64)
+        predecessors_csr = np.repeat(np.arange(n), np.diff(np.frombuffer(fg.offsets, dtype=np.int64)))
+
+        # Dense weight matrix, the cheapest of parallel edges wins
+        distances = np.full((n, n), INFINITY)
+        np.minimum.at(distances, (predecessors_csr, successors_csr), np.frombuffer(fg.weights, dtype=np.float64))
+        np.fill_diagonal(distances, np.minimum(distances.diagonal(), 0))
+
+        successors = np.full((n, n), -1, dtype=np.int32)
+        successors[predecessors_csr, successors_csr] = successors_csr
+        np.fill_diagonal(successors, -1)
+
+        # One vectorized relaxation of every pair through k per round
+        for k in range(n):
+            through_k = distances[:, k, None] + distances[None, k, :]
+            improved = through_k < distances
+            distances[improved] = through_k[improved]
+            successors[improved] = np.broadcast_to(successors[:, k, None], (n, n))[improved]
+
+        if (distances.diagonal() < 0).any():
+            raise LibgraphyError("Negative cycle found!")
+
+        return AllPairsShortestPaths(fg.graph, fg.vertices, distances, successors)
+
+    @staticmethod
+    def _potentials(fg: FrozenGraph) -> list[float]:
+        # Bellman-Ford (SPFA) from a virtual source joined to every vertex by a
+        # 0 edge: the distances make every reweighted edge non-negative
+        offsets, targets, weights = fg.offsets, fg.targets, fg.weights
+        n: int = len(fg)
+
+        potential: list[float] = [0] * n
+        length: list[int] = [0] * n
+        queue: Deque[int] = deque(range(n))
+        queued: bytearray = bytearray(b"\x01" * n)
+
+        while queue:
+            u: int = queue.popleft()
+            queued[u] = 0
+            for k in range(offsets[u], offsets[u+1]):
+                s = targets[k]
+                new_potential = potential[u] + weights[k]
+                if new_potential < potential[s]:
+                    potential[s] = new_potential
+                    # Paths from the virtual source have at most n edges
+                    length[s] = length[u] + 1
+                    if length[s] > n:
+                        raise LibgraphyError("Negative cycle found!")
+                    if not queued[s]:
+                        queue.append(s)
+                        queued[s] = 1
+
+        return potential
+
+    @staticmethod
+    def johnson(fg: FrozenGraph) -> AllPairsShortestPaths:
+        if not numpy_found:
+            raise ImportError("No NumPy found!")
+
+        offsets, targets, weights = fg.offsets, fg.targets, fg.weights
+        n: int = len(fg)
+
+        potential: list[float] = _AllPairs._potentials(fg)
+        reweighted: list[float] = [0.0] * len(targets)
+        for u in range(n):
+            for k in range(offsets[u], offsets[u+1]):
+                # Rounding must not leave tiny negative weights for Dijkstra
+                reweighted[k] = max(0.0, weights[k] + potential[u] - potential[targets[k]])
+
+        distances = np.full((n, n), INFINITY)
+        successors = np.full((n, n), -1, dtype=np.int32)
+
+        for start in range(n):
+            distance_from_start: list[float] = [INFINITY] * n
+            previous: list[int] = [-1] * n
+            visited: bytearray = bytearray(n)
+            order: list[int] = []
+
+            distance_from_start[start] = 0
+            heap: list[tuple[float, int]] = [(0, start)]
+
+            while heap:
+                distance, u = heappop(heap)
+                if visited[u]:
+                    continue
+                visited[u] = 1
+                order.append(u)
+
+                for k in range(offsets[u], offsets[u+1]):
+                    s = targets[k]
+                    new_path = distance + reweighted[k]
+                    if new_path < distance_from_start[s]:
+                        distance_from_start[s] = new_path
+                        previous[s] = u
+                        heappush(heap, (new_path, s))
+
+            # First vertex after start towards each vertex, in settling order
+            # so that a vertex's predecessor is always done before it
+            first: list[int] = [-1] * n
+            row = distances[start]
+            for v in order[1:]:
+                first[v] = v if previous[v] == start else first[previous[v]]
+                row[v] = distance_from_start[v] - potential[start] + potential[v]
+            row[start] = 0
+            successors[start] = first
+
+        return AllPairsShortestPaths(fg.graph, fg.vertices, distances, successors)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+__all__ = ["_Components"]
+
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Sequence
+if TYPE_CHECKING: # pragma: no cover
+    from .vertex import Vertex
+    from .edge import Edge
+
+class _Components:
+    @staticmethod
+    def strongly_connected(vertices: Iterable[Vertex]) -> Dict[Vertex, int]:
+        """Labels every vertex with its strongly connected component.
+
+        Iterative Tarjan, O(V+E) and not limited by the recursion depth.
+        Components are numbered in reverse topological order of the
+        condensation: every edge goes to a component with a smaller or equal label.
+        """
+        index: Dict[Vertex, int] = {}
+        low: Dict[Vertex, int] = {}
+        label: Dict[Vertex, int] = {}
+        stack: list[Vertex] = []
+        components: int = 0
+
+        for root in vertices:
+            if root in index:
+                continue
+
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            # DFS stack of (vertex, its remaining outgoing edges)
+            work: list[tuple[Vertex, Iterator[Edge]]] = [(root, iter(root.adjacent_edges))]
+
+            while work:
+                v, edges = work[-1]
+                for e in edges:
+                    w: Vertex = e.successor
+                    if w not in index:
+                        index[w] = low[w] = len(index)
+                        stack.append(w)
+                        work.append((w, iter(w.adjacent_edges)))
+                        break
+                    elif w not in label and index[w] < low[v]: # w is on the stack
+                        low[v] = index[w]
+                else:
+                    work.pop()
+                    if work:
+                        u: Vertex = work[-1][0]
+                        if low[v] < low[u]:
+                            low[u] = low[v]
+
+                    if low[v] == index[v]: # v is the root of a component
+                        while True:
+                            w = stack.pop()
+                            label[w] = components
+                            if w is v:
+                                break
+                        components += 1
+
+        return label
+
+    @staticmethod
+    def weakly_connected(vertices: Sequence[Vertex], edges: Iterable[Edge]) -> list[int]:
+        """Labels vertices[i] with its weakly connected component.
+
+        Union-find over vertex positions with path halving, O((V+E) log V) at
+        worst and close to linear in practice. Components are numbered in the
+        order their first vertex appears in vertices.
+        """
+        position: Dict[Vertex, int] = {v: i for i, v in enumerate(vertices)}
+        parent: list[int] = list(range(len(vertices)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for e in edges:
+            p = position.get(e.predecessor)
+            s = position.get(e.successor)
+            if p is None or s is None:
+                continue
+            p, s = find(p), find(s)
+            # The smaller position stays the root
+            if p < s:
+                parent[s] = p
+            elif s < p:
+                parent[p] = s
+
+        labels: list[int] = [0] * len(vertices)
+        root_label: Dict[int, int] = {}
+        for i in range(len(vertices)):
+            labels[i] = root_label.setdefault(find(i), len(root_label))
+
+        return labels
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+__all__ = ["ContractionHierarchy"]
+
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Optional
+if TYPE_CHECKING: # pragma: no cover
+    from .graph import Graph
+    from .vertex import Vertex
+    from .edge import Edge
+
+from array import array
+from collections import deque
+from heapq import heapify, heappush, heappop
+import json
+
+from .exception import LibgraphyError
+from .frozengraph import FrozenGraph
+from .path import Path
+
+INFINITY = float("inf")
+
+# Witness searches only follow paths of up to this many edges and add the
+# shortcut when none is found. Extra shortcuts, but never a wrong distance.
+WITNESS_HOP_LIMIT = 16
+
+# Adjacency of the remaining graph during contraction: neighbor -> (weight, CH edge)
+type _Adjacency = Dict[int, tuple[float, int]]
+
+class ContractionHierarchy:
+    """Contraction hierarchy of a Graph for fast point-to-point queries.
+
+    Vertices are contracted one by one, least important first, adding a
+    shortcut u -> w whenever the only shortest u -> w path goes through the
+    contracted vertex. A query is a bidirectional Dijkstra that only climbs
+    towards more important vertices: forward along the upward edges and
+    backward along the downward ones, both stored as CSR arrays of CH edge
+    ids. Shortcuts remember the two CH edges they replace, so paths unpack
+    to the original edges. It can also be built from a FrozenGraph snapshot.
+    Later changes to the source graph are not reflected.
+    """
+
+    def __init__(self, graph: Graph | FrozenGraph) -> None:
+        fg: FrozenGraph = graph if isinstance(graph, FrozenGraph) else FrozenGraph(graph)
+        if any(w < 0 for w in fg.weights):
+            raise LibgraphyError("Contraction hierarchies need non-negative edge values")
+
+        self.__bind(fg)
+        self.__contract(fg)
+
+    def __bind(self, fg: FrozenGraph) -> None:
+        self.graph: Graph = fg.graph
+        # vertex index <-> Vertex and original edges, as in the frozen graph
+        self.vertices: list[Vertex] = fg.vertices
+        self.indices: Dict[Vertex, int] = fg.indices
+        self.edges: list[Edge] = fg.edges
+        # Distances are given back with the type of the edge values
+        self.__value: Callable[[float], float] = fg._value
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def __repr__(self) -> str:
+        return f"ContractionHierarchy: {len(self.vertices)} vertices, {len(self.edges)} edges, {self.shortcuts()} shortcuts"
+
+    def __new_edge(self, tail: int, head: int, weight: float, original: int = -1, first: int = -1, second: int = -1) -> int:
+        self.tail.append(tail)
+        self.head.append(head)
+        self.weight.append(weight)
+        self.original.append(original)
+        self.first.append(first)
+        self.second.append(second)
+        return len(self.tail) - 1
+
+    def __witnesses(self, out_adj: list[_Adjacency], source: int, excluded: int, limit: float, targets: set[int]) -> Dict[int, float]:
+        # Dijkstra in the remaining graph without the vertex being contracted,
+        # bounded by the distance limit and the hop limit, that stops once
+        # every target is settled. Distances of unsettled vertices are still
+        # lengths of real paths.
+        distance_from_source: Dict[int, float] = {source: 0}
+        hops: Dict[int, int] = {source: 0}
+        heap: list[tuple[float, int]] = [(0, source)]
+        remaining: set[int] = set(targets)
+
+        while heap and remaining:
+            distance, u = heappop(heap)
+            if distance > distance_from_source[u]:
+                continue
+            if distance > limit:
+                break
+            remaining.discard(u)
+            if hops[u] == WITNESS_HOP_LIMIT:
+                continue
+
+            for s, (w, _) in out_adj[u].items():
+                if s == excluded:
+                    continue
+                new_path = distance + w
+                if new_path < distance_from_source.get(s, INFINITY):
+                    distance_from_source[s] = new_path
+                    hops[s] = hops[u] + 1
+                    heappush(heap, (new_path, s))
+
+        return distance_from_source
+
+    def __shortcuts(self, out_adj: list[_Adjacency], in_adj: list[_Adjacency], v: int) -> list[tuple[int, int, float, int, int]]:
+        # Shortcuts (u, w, weight, first CH edge, second CH edge) contracting v would need
+        shortcuts: list[tuple[int, int, float, int, int]] = []
+        if not out_adj[v]:
+            return shortcuts
+
+        max_out: float = max(w for w, _ in out_adj[v].values())
+        targets: set[int] = set(out_adj[v])
+        for u, (w1, e1) in in_adj[v].items():
+            witnesses: Dict[int, float] = self.__witnesses(out_adj, u, v, w1 + max_out, targets)
+            for s, (w2, e2) in out_adj[v].items():
+                if s != u and witnesses.get(s, INFINITY) > w1 + w2:
+                    shortcuts.append((u, s, w1 + w2, e1, e2))
+
+        return shortcuts
+
+    def __contract(self, fg: FrozenGraph) -> None:
+        n: int = len(fg)
+
+        # CH edges: original edges and shortcuts, the latter made of two CH edges
+        self.tail: array[int] = array('q')
+        self.head: array[int] = array('q')
+        self.weight: array[float] = array('d')
+        self.original: array[int] = array('q')
+        self.first: array[int] = array('q')
+        self.second: array[int] = array('q')
+
+        # Remaining graph, only the cheapest of parallel edges matters
+        out_adj: list[_Adjacency] = [{} for _ in range(n)]
+        in_adj: list[_Adjacency] = [{} for _ in range(n)]
+        for u in range(n):
+            for k in range(fg.offsets[u], fg.offsets[u+1]):
+                s, w = fg.targets[k], fg.weights[k]
+                if s == u or w >= out_adj[u].get(s, (INFINITY, -1))[0]:
+                    continue
+                e = self.__new_edge(u, s, w, original=k)
+                out_adj[u][s] = in_adj[s][u] = (w, e)
+
+        # Importance: edge difference, contracted neighbors and level in the
+        # hierarchy, weighted so that few shortcuts are added while contraction
+        # spreads over the graph and keeps the hierarchy shallow
+        contracted_neighbors: list[int] = [0] * n
+        level: list[int] = [0] * n
+
+        def importance(v: int, shortcuts: list) -> int:
+            return 3 * (len(shortcuts) - len(in_adj[v]) - len(out_adj[v])) + contracted_neighbors[v] + 2 * level[v]
+
+        heap: list[tuple[int, int]] = [(importance(v, self.__shortcuts(out_adj, in_adj, v)), v) for v in range(n)]
+        heapify(heap)
+
+        self.rank: array[int] = array('q', [0] * n)
+        up: list[list[int]] = [[] for _ in range(n)]
+        down: list[list[int]] = [[] for _ in range(n)]
+        contracted: int = 0
+
+        while heap:
+            _, v = heappop(heap)
+
+            # Lazy updates: contract v only if it is still the least important
+            shortcuts = self.__shortcuts(out_adj, in_adj, v)
+            priority: int = importance(v, shortcuts)
+            if heap and priority > heap[0][0]:
+                heappush(heap, (priority, v))
+                continue
+
+            self.rank[v] = contracted
+            contracted += 1
+
+            for u, s, w, e1, e2 in shortcuts:
+                if w < out_adj[u].get(s, (INFINITY, -1))[0]:
+                    e = self.__new_edge(u, s, w, first=e1, second=e2)
+                    out_adj[u][s] = in_adj[s][u] = (w, e)
+
+            # Edges left at v all lead to more important vertices
+            for s, (_, e) in out_adj[v].items():
+                up[v].append(e)
+                del in_adj[s][v]
+                contracted_neighbors[s] += 1
+                level[s] = max(level[s], level[v] + 1)
+            for u, (_, e) in in_adj[v].items():
+                down[v].append(e)
+                del out_adj[u][v]
+                contracted_neighbors[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+            out_adj[v].clear()
+            in_adj[v].clear()
+
+        self.up_offsets, self.up_edges = ContractionHierarchy.__csr(up)
+        self.down_offsets, self.down_edges = ContractionHierarchy.__csr(down)
+
+    @staticmethod
+    def __csr(adjacency: list[list[int]]) -> tuple[array[int], array[int]]:
+        offsets: array[int] = array('q', [0])
+        edges: array[int] = array('q')
+        for ch_edges in adjacency:
+            edges.extend(ch_edges)
+            offsets.append(len(edges))
+        return offsets, edges
+
+    def index(self, vertex: Vertex) -> int:
+        i = self.indices.get(vertex)
+        if i is None:
+            raise LibgraphyError(f"Vertex {vertex} does not belong to the contraction hierarchy")
+        return i
+
+    def shortcuts(self) -> int:
+        """Number of shortcut edges added by the contraction"""
+        return sum(1 for k in self.original if k < 0)
+
+    def find_path(self, start: Vertex, end: Vertex) -> Path:
+        s, t = self.index(start), self.index(end)
+
+        # Forward search climbs the upward edges from s, the backward one the
+        # downward edges from t. Both only ever reach more important vertices.
+        directions = [
+            (self.up_offsets, self.up_edges, self.head, {s: 0.0}, {s: -1}, [(0.0, s)]),
+            (self.down_offsets, self.down_edges, self.tail, {t: 0.0}, {t: -1}, [(0.0, t)]),
+        ]
+        settled: int = 0
+
+        best: float = INFINITY
+        meeting: int = -1
+
+        while directions[0][5] or directions[1][5]:
+            for d, (offsets, ch_edges, other_end, distance_from_root, previous, heap) in enumerate(directions):
+                # Nothing left below the best path found so far in this direction
+                if heap and heap[0][0] >= best:
+                    heap.clear()
+                if not heap:
+                    continue
+
+                distance, u = heappop(heap)
+                if distance > distance_from_root[u]:
+                    continue # Outdated entry
+                settled += 1
+
+                total: float = distance + directions[1 - d][3].get(u, INFINITY)
+                if total < best:
+                    best, meeting = total, u
+
+                for i in range(offsets[u], offsets[u+1]):
+                    e: int = ch_edges[i]
+                    x: int = other_end[e]
+                    new_path = distance + self.weight[e]
+                    if new_path < distance_from_root.get(x, INFINITY):
+                        distance_from_root[x] = new_path
+                        previous[x] = e
+                        heappush(heap, (new_path, x))
+
+        path: Path = Path(self.graph)
+        path.value = self.__value(best)
+        path.settled = settled
+        if meeting < 0:
+            return path
+
+        # CH edges s -> meeting, then meeting -> t
+        ch_path: Deque[int] = deque()
+        forward_previous, backward_previous = directions[0][4], directions[1][4]
+        v: int = meeting
+        while forward_previous[v] >= 0:
+            ch_path.appendleft(forward_previous[v])
+            v = self.tail[forward_previous[v]]
+        v = meeting
+        while backward_previous[v] >= 0:
+            ch_path.append(backward_previous[v])
+            v = self.head[backward_previous[v]]
+
+        path.edges = self.__unpack(ch_path)
+        return path
+
+    def __unpack(self, ch_path: Deque[int]) -> list[Edge]:
+        # Shortcuts are replaced by their two halves until only original edges are left
+        edges: list[Edge] = []
+        stack: list[int] = list(reversed(ch_path))
+        while stack:
+            e: int = stack.pop()
+            if self.original[e] >= 0:
+                edges.append(self.edges[self.original[e]])
+            else:
+                stack.append(self.second[e])
+                stack.append(self.first[e])
+        return edges
+
+    __arrays: tuple[str, ...] = ("tail", "head", "weight", "original", "first", "second", "rank",
+                                 "up_offsets", "up_edges", "down_offsets", "down_edges")
+
+    @staticmethod
+    def to_json(ch: ContractionHierarchy) -> str:
+        data: Dict[str, object] = {"vertices": len(ch.vertices), "edges": len(ch.edges)}
+        for name in ContractionHierarchy.__arrays:
+            data[name] = getattr(ch, name).tolist()
+        return json.dumps(data)
+
+    @staticmethod
+    def write_to_json_file(ch: ContractionHierarchy, filename: str) -> None:
+        json_str = ContractionHierarchy.to_json(ch)
+        with open(filename, 'w+') as f:
+            f.write(json_str)
+
+    @staticmethod
+    def from_json(json_str: str, graph: Graph) -> ContractionHierarchy:
+        """Hierarchy saved with to_json, for the same (unchanged) graph"""
+        data = json.loads(json_str)
+
+        fg: FrozenGraph = FrozenGraph(graph)
+        if data["vertices"] != len(fg) or data["edges"] != len(fg.edges):
+            raise LibgraphyError("Contraction hierarchy does not match the graph")
+
+        ch: ContractionHierarchy = ContractionHierarchy.__new__(ContractionHierarchy)
+        ch.__bind(fg)
+        for name in ContractionHierarchy.__arrays:
+            setattr(ch, name, array('d' if name == "weight" else 'q', data[name]))
+
+        for e, k in enumerate(ch.original):
+            if k >= 0 and fg.weights[k] != ch.weight[e]:
+                raise LibgraphyError("Contraction hierarchy does not match the graph")
+
+        return ch
+
+    @staticmethod
+    def read_from_json_file(filename: str, graph: Graph) -> ContractionHierarchy:
+        json_str = ''
+        with open(filename) as f:
+            json_str = f.read()
+        return ContractionHierarchy.from_json(json_str, graph)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 __all__ = ["Edge", "_EdgeList"]
 
-from typing import Optional, Self, Any, TYPE_CHECKING, override
+from typing import Optional, Self, Any, Dict, Iterable, SupportsIndex, TYPE_CHECKING, override
 if TYPE_CHECKING: # pragma: no cover
     from .graph import Graph
 
@@ -30,11 +30,27 @@ class Edge:
 
         self.value: Any = value
         self.graph: Optional[Graph] = graph
-        
-        if self not in self.predecessor.adjacent_edges:
-            self.predecessor.adjacent_edges.append(self)
-        if self.successor not in self.predecessor.neighbors:
-            self.predecessor.neighbors.append(self.successor)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        old: Any = self.__dict__.get(key)
+        graph: Optional[Graph] = self.__dict__.get("graph")
+        if graph is None or key not in ("value", "predecessor", "successor"):
+            super().__setattr__(key, value)
+            return
+
+        if key == "value":
+            super().__setattr__(key, value)
+            graph._edge_reweighted(self, old)
+            return
+
+        # Looked up under the old endpoints, before they change
+        in_graph: bool = self in graph.edges
+        key_before: tuple[Vertex, Vertex] = (self.predecessor, self.successor)
+        super().__setattr__(key, value)
+        if in_graph:
+            graph.edges._rekey(self, key_before)
+        else:
+            graph._touch()
 
     def __imul__(self, scalar: int | float) -> Self:
         self.value *= scalar
@@ -72,7 +88,14 @@ class Edge:
             
         # Add self to edges and swap direction
         self.successor.adjacent_edges.append(self)
-        self.predecessor, self.successor = self.successor, self.predecessor
+        # Both endpoints are swapped at once, then rekeyed once
+        key = (self.predecessor, self.successor)
+        in_graph: bool = self.graph is not None and self in self.graph.edges
+        self.__dict__["predecessor"], self.__dict__["successor"] = self.successor, self.predecessor
+        if in_graph:
+            self.graph.edges._rekey(self, key)
+        elif self.graph is not None:
+            self.graph._touch()
         
         # Return edge for chaining
         return self
@@ -119,9 +142,8 @@ class Edge:
     # don't move this !!
     def _graph__iadd__(self, graph: Graph) -> Graph:
         # Don't change the order of errors !!
-        for e in graph.edges:
-            if e.successor is self.successor and e.predecessor is self.predecessor:
-                raise LibgraphyError(f"Edge already exists ({e.predecessor}->{e.successor})")
+        if (self.predecessor, self.successor) in graph.edges:
+            raise LibgraphyError(f"Edge already exists ({self.predecessor}->{self.successor})")
 
         if self.graph is not None:
             raise LibgraphyError("Edge belongs to a different graph")
@@ -177,8 +199,167 @@ class Edge:
     # ***************************
 
 class _EdgeList(list):
+    # The (predecessor, successor) -> Edge index and the successor -> incoming
+    # edges index live in slots, so they are neither serialized by jsonpickle
+    # nor shared between copies. They are built lazily on the first lookup and
+    # kept in sync by the mutating methods.
+    __slots__ = ("__index", "__incoming", "__dict__")
+
     def __init__(self, graph: Optional[Graph] = None) -> None:
+        super().__init__()
         self.graph: Optional[Graph] = graph
+        self.__index: Optional[Dict[tuple[Vertex, Vertex], Edge]] = None
+        self.__incoming: Optional[Dict[Vertex, list[Edge]]] = None
+
+    def __built_index(self) -> Optional[Dict[tuple[Vertex, Vertex], Edge]]:
+        try:
+            return self.__index
+        except AttributeError: # restored by jsonpickle
+            return None
+
+    def __built_incoming(self) -> Optional[Dict[Vertex, list[Edge]]]:
+        try:
+            return self.__incoming
+        except AttributeError: # restored by jsonpickle
+            return None
+
+    def _index(self) -> Dict[tuple[Vertex, Vertex], Edge]:
+        index = self.__built_index()
+        if index is None:
+            index = {}
+            for e in self:
+                index.setdefault((e.predecessor, e.successor), e)
+            self.__index = index
+        return index
+
+    def _incoming(self, vertex: Vertex) -> list[Edge]:
+        """Edges ending at vertex (reverse adjacency)"""
+        incoming = self.__built_incoming()
+        if incoming is None:
+            incoming = {}
+            for e in self:
+                incoming.setdefault(e.successor, []).append(e)
+            self.__incoming = incoming
+        return incoming.get(vertex, [])
+
+    def __index_add(self, e: Edge) -> None:
+        index = self.__built_index()
+        if index is not None:
+            index.setdefault((e.predecessor, e.successor), e)
+        incoming = self.__built_incoming()
+        if incoming is not None:
+            incoming.setdefault(e.successor, []).append(e)
+
+    def __index_discard(self, e: Edge, key: Optional[tuple[Vertex, Vertex]] = None) -> None:
+        p, s = key if key is not None else (e.predecessor, e.successor)
+        index = self.__built_index()
+        if index is not None and index.get((p, s)) is e:
+            del index[(p, s)]
+        incoming = self.__built_incoming()
+        if incoming is not None:
+            edges = incoming.get(s, [])
+            for i, x in enumerate(edges):
+                if x is e:
+                    del edges[i]
+                    break
+
+    def __invalidate(self) -> None:
+        self.__index = None
+        self.__incoming = None
+
+    def __owner(self) -> Optional[Graph]:
+        # Only the edge list of a graph reports changes to that graph
+        graph: Optional[Graph] = self.__dict__.get("graph")
+        if graph is not None and graph.__dict__.get("edges") is self:
+            return graph
+        return None
+
+    def __added(self, e: Edge) -> None:
+        graph = self.__owner()
+        if graph is not None:
+            graph._edge_added(e)
+
+    def __removed(self, e: Edge) -> None:
+        graph = self.__owner()
+        if graph is not None:
+            graph._edge_removed(e)
+
+    def __reset(self) -> None:
+        self.__invalidate()
+        graph = self.__owner()
+        if graph is not None:
+            graph._edges_reset()
+
+    def _rekey(self, e: Edge, key: tuple[Vertex, Vertex]) -> None:
+        # Edge e of this list used to be indexed under key (before an endpoint changed or it was reversed)
+        self.__index_discard(e, key)
+        self.__index_add(e)
+        graph = self.__owner()
+        if graph is not None:
+            graph._edge_reversed(e, key[0])
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> _EdgeList:
+        edges = _EdgeList()
+        memo[id(self)] = edges
+        edges.__dict__.update(deepcopy(self.__dict__, memo))
+        list.extend(edges, (deepcopy(e, memo) for e in self))
+        return edges
+
+    @override
+    def append(self, e: Edge) -> None:
+        super().append(e)
+        self.__index_add(e)
+        self.__added(e)
+
+    @override
+    def extend(self, edges: Iterable[Edge]) -> None:
+        for e in edges:
+            self.append(e)
+
+    @override
+    def __iadd__(self, edges: Iterable[Edge]) -> Self:
+        self.extend(edges)
+        return self
+
+    @override
+    def insert(self, i: SupportsIndex, e: Edge) -> None:
+        super().insert(i, e)
+        self.__index_add(e)
+        self.__added(e)
+
+    @override
+    def remove(self, e: Edge) -> None:
+        super().remove(e)
+        self.__index_discard(e)
+        self.__removed(e)
+
+    @override
+    def pop(self, i: SupportsIndex = -1) -> Edge:
+        e: Edge = super().pop(i)
+        self.__index_discard(e)
+        self.__removed(e)
+        return e
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self.__reset()
+
+    @override
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        if isinstance(key, slice):
+            super().__delitem__(key)
+            self.__reset()
+        else:
+            self.pop(key)
+
+    @override
+    def __contains__(self, key: Any) -> bool:
+        if isinstance(key, tuple):
+            return key in self._index()
+        elif isinstance(key, Edge):
+            return self._index().get((key.predecessor, key.successor)) is key
+        return super().__contains__(key)
 
     def start_at(self, start_vertex: Vertex) -> _EdgeList:
         startingAt = _EdgeList()
@@ -203,15 +384,9 @@ class _EdgeList(list):
     @override
     def __getitem__(self, key: Any) -> Edge|None:
         if isinstance(key, tuple):
-            for e in self:
-                if e.predecessor == key[0] and e.successor == key[1]:
-                    return e
-            return None
+            return self._index().get(key)
         elif isinstance(key, Edge):
-            for e in self:
-                if e.predecessor == key.predecessor and e.successor == key.successor:
-                    return e
-            return None
+            return self._index().get((key.predecessor, key.successor))
         else:
             return super().__getitem__(key)
         
@@ -3,19 +3,26 @@ from __future__ import annotations
 __all__ = ["Graph"]
 
 from random import uniform, randrange
-from typing import TYPE_CHECKING, Self, Dict, Optional, Any, cast, Literal
-if TYPE_CHECKING: # pragma: no cover
-    from .path import Path
+from typing import TYPE_CHECKING, Self, Callable, Deque, Dict, Iterable, Iterator, Optional, Any, cast, Literal
 
 from .heuristic import Heuristic
+from .path import Path
 
-from .vertex import Vertex
+from .vertex import Vertex, _VertexList
 from .edge import Edge, _EdgeList
 
-from .algorithm import _Algorithm, _AlgorithmFunction, AlgorithmEnum
+from .algorithm import _Algorithm, _AlgorithmFunction, _TreeAlgorithmFunction, AlgorithmEnum, ShortestPathTree
+from .frozengraph import FrozenGraph, _FrozenSearchFunction, _init_worker, _worker_row
+from .allpairs import AllPairsShortestPaths, _AllPairs
+from .contraction import ContractionHierarchy
+from .components import _Components
 from .exception import LibgraphyError
 
 from enum import Enum, auto
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+INFINITY = float("inf")
 
 import jsonpickle
 import json
@@ -40,6 +47,12 @@ try:
 except ImportError:
     scipy_found = False
 
+try:
+    import numpy as np
+    numpy_found = True
+except ImportError:
+    numpy_found = False
+
 try:
     import IPython.display as ipds
     ipds_found = True
@@ -53,20 +66,139 @@ class GraphFormat(Enum):
     NETWORKX = auto()
     CSGRAPH = auto()
 
+class _LazyTrait:
+    # Graph.Traits property. Unchecked traits read as None, unless the traits
+    # are lazy: then the first read runs the check method and later reads
+    # return the memoised result.
+
+    def __init__(self, check: str) -> None:
+        self.check: str = check
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name: str = name
+
+    def __get__(self, gt: Optional[Graph.Traits], owner: Optional[type] = None) -> Any:
+        if gt is None:
+            return self
+        if self.name not in gt.__dict__ and gt.lazy:
+            getattr(gt, self.check)()
+        return gt.__dict__.get(self.name)
+
+    def __set__(self, gt: Graph.Traits, value: Any) -> None:
+        gt.__dict__[self.name] = value
+
+def _is_negative(value: Any) -> bool:
+    try:
+        return value < 0
+    except TypeError: # non-numeric edge value
+        return False
+
+def _integer_weight(value: Any) -> Optional[int]:
+    # value as a non-negative integer, None if it is not one
+    try:
+        if value >= 0 and value == int(value):
+            return int(value)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return None
+
+class _TraitCounters:
+    # Edge statistics behind the O(1) traits of a graph. Built in one pass over
+    # the edges, then kept up to date by the graph's edge list and its edges.
+
+    def __init__(self, edges: Iterable[Edge]) -> None:
+        self.negative: int = 0
+        self.non_unit: int = 0
+        self.non_integer: int = 0
+        # non-negative integer weight -> number of edges with that weight
+        self.integer_weights: Dict[int, int] = {}
+        self.out_degree: Dict[Vertex, int] = {}
+        # out-degree -> number of vertices with that out-degree (> 0)
+        self.degree_count: Dict[int, int] = {}
+
+        for e in edges:
+            self.add(e)
+
+    def __degree(self, v: Vertex, delta: int) -> None:
+        d: int = self.out_degree.get(v, 0)
+        if d > 0:
+            self.degree_count[d] -= 1
+            if self.degree_count[d] == 0:
+                del self.degree_count[d]
+        d += delta
+        if d > 0:
+            self.out_degree[v] = d
+            self.degree_count[d] = self.degree_count.get(d, 0) + 1
+        else:
+            self.out_degree.pop(v, None)
+
+    def add(self, e: Edge) -> None:
+        self.reweight(None, e.value)
+        self.__degree(e.predecessor, 1)
+
+    def discard(self, e: Edge) -> None:
+        self.reweight(e.value, None)
+        self.__degree(e.predecessor, -1)
+
+    def reweight(self, old: Any, new: Any) -> None:
+        # None stands for no edge
+        if old is not None:
+            self.negative -= _is_negative(old)
+            self.non_unit -= (old != 1)
+            self.__integer_weight(old, -1)
+        if new is not None:
+            self.negative += _is_negative(new)
+            self.non_unit += (new != 1)
+            self.__integer_weight(new, 1)
+
+    def __integer_weight(self, value: Any, delta: int) -> None:
+        w: Optional[int] = _integer_weight(value)
+        if w is None:
+            self.non_integer += delta
+            return
+        count: int = self.integer_weights.get(w, 0) + delta
+        if count > 0:
+            self.integer_weights[w] = count
+        else:
+            del self.integer_weights[w]
+
+    def reverse(self, e: Edge, old_predecessor: Vertex) -> None:
+        self.__degree(old_predecessor, -1)
+        self.__degree(e.predecessor, 1)
+
+    def max_out_degree(self) -> int:
+        return max(self.degree_count, default=0)
+
+    def max_integer_weight(self) -> Optional[int]:
+        if self.non_integer > 0:
+            return None
+        return max(self.integer_weights, default=None)
+
 class Graph:
-    class Traits:
+    # Cached traits, the generation they were computed at, the trait counters,
+    # the component labels, the contraction hierarchy and the CSR snapshot live
+    # in slots, so they are not serialized by jsonpickle.
+    __slots__ = ("__generation", "__traits", "__counters", "__components", "__ch", "__frozen", "__dict__")
 
-        def __init__(self, g: Graph) -> None:
+    class Traits:
+        is_weighted: bool|None = _LazyTrait("check_if_weighted")
+        has_negative_edges: bool|None = _LazyTrait("check_if_negative_edges")
+        is_directional: bool|None = _LazyTrait("check_if_directional")
+        is_grid: bool|None = _LazyTrait("check_if_grid")
+        grid_level: int|None = _LazyTrait("get_grid_level")
+        has_cycles: bool|None = _LazyTrait("check_if_has_cycles")
+        is_full: bool|None = _LazyTrait("check_if_full")
+        is_empty: bool|None = _LazyTrait("check_if_empty")
+        is_connected: bool|None = _LazyTrait("check_if_connected")
+        has_integer_weights: bool|None = _LazyTrait("check_if_integer_weights")
+        max_weight: int|None = _LazyTrait("get_max_weight")
+
+        def __init__(self, g: Graph, lazy: bool = False) -> None:
             self.graph: Graph = g
-            self.is_weighted: bool|None = None
-            self.has_negative_edges: bool|None = None
-            self.is_directional: bool|None = None
-            self.is_grid: bool|None = None
-            self.grid_level: int|None = None
-            self.has_cycles: bool|None = None
-            self.is_full: bool|None = None
-            self.is_empty: bool|None = None
-            self.is_connected: bool|None = None
+            # Lazy traits are computed on first access, see _LazyTrait
+            self.lazy: bool = lazy
+            # Generation of the graph the traits were computed at
+            self.generation: int = g._generation()
 
         def __repr__(self) -> str:
             repr_txt = "Graph traits:\n"
@@ -79,7 +211,9 @@ class Graph:
             repr_txt += '  has_cycles: ' + str(self.has_cycles) + '\n'
             repr_txt += '  is_full: ' + str(self.is_full) + '\n'
             repr_txt += '  is_empty: ' + str(self.is_empty) + '\n'
-            repr_txt += '  is_connected: '+ str(self.is_connected)
+            repr_txt += '  is_connected: '+ str(self.is_connected) + '\n'
+            repr_txt += '  has_integer_weights: ' + str(self.has_integer_weights) + '\n'
+            repr_txt += '  max_weight: ' + str(self.max_weight)
 
             return repr_txt
 
@@ -106,13 +240,20 @@ class Graph:
             latex_txt += " \\\\ \n"
             latex_txt += r'  is\_empty: ' + str(self.is_empty) + '\n'
             latex_txt += " \\\\ \n"
-            latex_txt += r'  is\_connected: ' + str(self.is_connected)
+            latex_txt += r'  is\_connected: ' + str(self.is_connected) + '\n'
+            latex_txt += " \\\\ \n"
+            latex_txt += r'  has\_integer\_weights: ' + str(self.has_integer_weights) + '\n'
+            latex_txt += " \\\\ \n"
+            latex_txt += r'  max\_weight: ' + str(self.max_weight)
 
             latex_txt += r"\end{gathered}$$"
 
             return latex_txt
 
         def check_if_weighted(self) -> None:
+            if self.lazy:
+                self.is_weighted = self.graph._trait_counters().non_unit > 0
+                return
             for e in self.graph.edges:
                 if e.value != 1:
                     self.is_weighted = True
@@ -121,12 +262,33 @@ class Graph:
 
         # TODO: test
         def check_if_negative_edges(self) -> None:
+            if self.lazy:
+                self.has_negative_edges = self.graph._trait_counters().negative > 0
+                return
             for e in self.graph.edges:
                 if e.value < 0:
                     self.has_negative_edges = True
                     return
             self.has_negative_edges = False
 
+        def check_if_integer_weights(self) -> None:
+            # All edge values are non-negative integers (0-1 BFS and Dial's algorithm)
+            if self.lazy:
+                self.has_integer_weights = self.graph._trait_counters().non_integer == 0
+                return
+            self.has_integer_weights = all(_integer_weight(e.value) is not None for e in self.graph.edges)
+
+        def get_max_weight(self) -> None:
+            # Largest edge value, only for integer weights
+            if self.has_integer_weights is None:
+                raise LibgraphyError("Check first if graph has integer weights!")
+            if self.has_integer_weights is False:
+                return
+            if self.lazy:
+                self.max_weight = self.graph._trait_counters().max_integer_weight()
+                return
+            self.max_weight = max((int(e.value) for e in self.graph.edges), default=None)
+
         def check_if_directional(self) -> None:
             visited: set[Vertex] = set()
 
@@ -150,8 +312,10 @@ class Graph:
             self.is_directional = False
 
         def check_if_grid(self) -> None:
-            self.check_if_weighted()
-            self.check_if_directional()
+            # Lazy traits only check directionality of unweighted graphs
+            if not self.lazy:
+                self.check_if_weighted()
+                self.check_if_directional()
             self.is_grid = (self.is_weighted is False and \
                     self.is_directional is False)
 
@@ -160,45 +324,22 @@ class Graph:
                 raise LibgraphyError("Check first if graph is a grid!")
             if self.is_grid is False:
                 return
+            if self.lazy:
+                self.grid_level = self.graph._trait_counters().max_out_degree()
+                return
             self.grid_level = 0
             for v in self.graph.vertices:
                 self.grid_level = max(self.grid_level, len(v.neighbors))
 
-        def _cycles_util(self, v: Vertex, visited: dict[Vertex, bool], rec_stack: dict[Vertex, bool]):
-
-          if rec_stack[v]:
-            return True # Vertex already in a stack -> Cycle detected
-
-          if visited[v]:
-            return False
-
-          visited[v] = True
-          rec_stack[v] = True
-
-          for n in v:
-            if self._cycles_util(n, visited, rec_stack):
-                return True
-
-          rec_stack[v] = False
-          return False
-
         def check_if_has_cycles(self) -> None:
-            # Based on:
-            # https://www.geeksforgeeks.org/dsa/detect-cycle-in-a-graph/
-            visited: dict[Vertex, bool] = {} # Track visited vertices
-            rec_stack: dict[Vertex, bool] = {} # Track visited vertices
-
-            for v in self.graph.vertices:
-              visited[v] = False
-              rec_stack[v] = False
-
-            for v in self.graph.vertices:
-              if not visited[v] and self._cycles_util(v, visited, rec_stack):
-                self.has_cycles = True # Cycle found
+            # A cycle is either a self-loop or a strongly connected component
+            # of two or more vertices
+            labels: Dict[Vertex, int] = self.graph._scc_labels()
+            if len(set(labels.values())) < len(labels):
+                self.has_cycles = True
                 return
 
-            self.has_cycles = False # No cycle found
-            return
+            self.has_cycles = any(e.predecessor is e.successor for e in self.graph.edges)
 
         def check_if_full(self) -> None:
             n = len(self.graph.vertices)
@@ -211,25 +352,9 @@ class Graph:
             self.is_empty = False
 
         def check_if_connected(self) -> None:
-            if len(self.graph.vertices) < 2:
-                self.is_connected = True
-                return
+            # Weak connectivity: edge directions are ignored
+            self.is_connected = len(self.graph.connected_components()) <= 1
 
-            explored = [self.graph.vertices[0]]
-            queue = [self.graph.vertices[0]]
-            unconnected = self.graph.vertices.copy()
-            unconnected.remove(queue[0])
-            while len(queue)>0 and len(unconnected)>0:
-                v1 = queue.pop()
-                explored.append(v1)
-                for v2 in v1.neighbors:
-                    if v2 in explored:
-                        continue
-                    queue.append(v2)
-                    if v2 in unconnected:
-                        unconnected.remove(v2)
-            self.is_connected = (len(unconnected) == 0)
-            
         @staticmethod
         def traits(g: Graph) -> Graph.Traits:
             gt: Graph.Traits = Graph.Traits(g)
@@ -240,6 +365,8 @@ class Graph:
             gt.check_if_full()
             gt.check_if_empty()
             gt.check_if_connected()
+            gt.check_if_integer_weights()
+            gt.get_max_weight()
 
             return gt
 
@@ -248,13 +375,40 @@ class Graph:
             AlgorithmEnum.DIJKSTRA: _Algorithm.dijkstra,
             AlgorithmEnum.BELLMAN_FORD: _Algorithm.bellman_ford,
             AlgorithmEnum.BEST: _Algorithm.best,
-            AlgorithmEnum.A_STAR: _Algorithm.a_star
+            AlgorithmEnum.A_STAR: _Algorithm.a_star,
+            AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA: _Algorithm.bidirectional_dijkstra,
+            AlgorithmEnum.BELLMAN_FORD_NUMPY: _Algorithm.bellman_ford_numpy,
+            AlgorithmEnum.BFS: _Algorithm.bfs,
+            AlgorithmEnum.ZERO_ONE_BFS: _Algorithm.zero_one_bfs,
+            AlgorithmEnum.DIAL: _Algorithm.dial,
+            AlgorithmEnum.DAG: _Algorithm.dag,
+            AlgorithmEnum.CH: _Algorithm.ch,
+            AlgorithmEnum.JPS: _Algorithm.jps,
+            AlgorithmEnum.DELTA_STEPPING: _Algorithm.delta_stepping
+    }
+
+    # Algorithms that settle every vertex reachable from the start
+    __tree_algorithms: Dict[AlgorithmEnum, _TreeAlgorithmFunction] = {
+            AlgorithmEnum.DIJKSTRA: _Algorithm.dijkstra_tree,
+            AlgorithmEnum.BELLMAN_FORD: _Algorithm.bellman_ford_tree,
+            AlgorithmEnum.BFS: _Algorithm.bfs_tree,
+            AlgorithmEnum.ZERO_ONE_BFS: _Algorithm.zero_one_bfs_tree,
+            AlgorithmEnum.DIAL: _Algorithm.dial_tree,
+            AlgorithmEnum.DAG: _Algorithm.dag_tree,
+            AlgorithmEnum.DELTA_STEPPING: _Algorithm.delta_stepping_tree,
+            AlgorithmEnum.BEST: _Algorithm.best_tree
+    }
+
+    __all_pairs_algorithms: Dict[AlgorithmEnum, Callable[[FrozenGraph], AllPairsShortestPaths]] = {
+            AlgorithmEnum.JOHNSON: _AllPairs.johnson,
+            AlgorithmEnum.FLOYD_WARSHALL: _AllPairs.floyd_warshall,
+            AlgorithmEnum.BEST: _AllPairs.best
     }
 
     # TODO: implement incidence matrix
     def __init__(self, incidence_matrix = None) -> None:
-        self.vertices: list[Vertex] = []
-        self.edges: _EdgeList[Edge] = _EdgeList()
+        self.vertices: _VertexList[Vertex] = _VertexList(self)
+        self.edges: _EdgeList[Edge] = _EdgeList(self)
 
     # get i-th vertex of the graph
     def __getitem__(self, key: int) -> Vertex:
@@ -311,16 +465,14 @@ class Graph:
         return element._graph__add__(self)
 
     def __imul__(self, scalar: int | float) -> Self:
-        self.edges = [Edge(e.predecessor, e.successor, e.value * scalar, self) for e in self.edges]
+        # Scaled in place, so adjacency and the edge index keep the same edges
+        for e in self.edges:
+            e.value *= scalar
         return self
 
     def __mul__(self, scalar: int | float) -> Graph:
-        tmp_edges = self.edges
-
-        self *= scalar
         g = deepcopy(self)
-
-        self.edges = tmp_edges
+        g *= scalar
 
         return g
 
@@ -404,10 +556,214 @@ class Graph:
         return latex_txt
 
     def find_path(self, start: Vertex, end: Vertex, heuristic: Heuristic = Heuristic(), algorithm: AlgorithmEnum = AlgorithmEnum.BEST) -> Path:
-        path_algorithm: _AlgorithmFunction = self.__algorithms[algorithm]
+        path_algorithm: Optional[_AlgorithmFunction] = self.__algorithms.get(algorithm)
+        if path_algorithm is None:
+            raise LibgraphyError(f"{algorithm.name} does not find single paths")
+
+        # Up to date component labels prove some targets unreachable without a search
+        labels: Optional[Dict[Vertex, int]] = self.__built_components()
+        if labels is not None and labels.get(end, -1) > labels.get(start, INFINITY):
+            p: Path = Path(self)
+            p.value = INFINITY
+            return p
+
         p: Path = path_algorithm(self, start, end, heuristic)
         return p
 
+    def shortest_path_tree(self, start: Vertex, algorithm: AlgorithmEnum = AlgorithmEnum.BEST) -> ShortestPathTree:
+        tree_algorithm: Optional[_TreeAlgorithmFunction] = self.__tree_algorithms.get(algorithm)
+        if tree_algorithm is None:
+            raise LibgraphyError(f"{algorithm.name} does not build a shortest path tree")
+        return tree_algorithm(self, start)
+
+    def distance_matrix(self, sources: Optional[Iterable[Vertex]] = None, targets: Optional[Iterable[Vertex]] = None, algorithm: AlgorithmEnum = AlgorithmEnum.BEST,
+                        return_predecessors: bool = False, workers: int = 1) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """Distances from each source (rows) to each target (columns), all vertices by default.
+
+        One search per source, stopped once every target is settled; unreachable
+        targets are at infinity. With return_predecessors, a second matrix holds
+        for each source the position in vertices of every vertex's predecessor
+        on its path, -1 if there is none (as in scipy.sparse.csgraph). Sources
+        are split among workers processes, each sent the CSR arrays of the
+        graph once.
+        """
+        if not numpy_found:
+            raise ImportError("No NumPy found!")
+        if workers < 1:
+            raise LibgraphyError(f"Cannot run with {workers} workers")
+
+        fg: FrozenGraph = self._frozen()
+        if algorithm == AlgorithmEnum.BEST:
+            # Chosen once for every source
+            algorithm = _Algorithm.best_algorithm(fg.traits())
+        search: _FrozenSearchFunction = fg._search(algorithm)
+
+        source_indices: list[int] = [fg.index(v) for v in (self.vertices if sources is None else sources)]
+        target_indices: Optional[list[int]] = None if targets is None else [fg.index(v) for v in targets]
+
+        rows: Iterable[tuple[list[float], Optional[np.ndarray]]]
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(fg.offsets, fg.targets, fg.weights, fg.values, algorithm, target_indices, return_predecessors)) as pool:
+                rows = list(pool.map(_worker_row, source_indices, chunksize=max(1, len(source_indices) // (4 * workers))))
+        else:
+            rows = (fg._search_row(search, s, target_indices, return_predecessors) for s in source_indices)
+
+        distances: np.ndarray = np.full((len(source_indices), len(fg) if target_indices is None else len(target_indices)), INFINITY)
+        predecessors: np.ndarray = np.full((len(source_indices), len(fg)), -1, dtype=np.int64)
+        for i, (distance_row, predecessor_row) in enumerate(rows):
+            distances[i] = distance_row
+            if predecessor_row is not None:
+                predecessors[i] = predecessor_row
+
+        if return_predecessors:
+            return distances, predecessors
+        return distances
+
+    def all_pairs_shortest_paths(self, algorithm: AlgorithmEnum = AlgorithmEnum.BEST) -> AllPairsShortestPaths:
+        """Distance and successor matrices between every pair of vertices.
+
+        JOHNSON reweights the edges with one Bellman-Ford pass, then runs
+        Dijkstra from every vertex, which suits sparse graphs. FLOYD_WARSHALL
+        relaxes a dense NumPy weight matrix, which suits dense ones. BEST
+        picks one from the edge density.
+        """
+        all_pairs_algorithm: Optional[Callable[[FrozenGraph], AllPairsShortestPaths]] = self.__all_pairs_algorithms.get(algorithm)
+        if all_pairs_algorithm is None:
+            raise LibgraphyError(f"{algorithm.name} does not find all pairs shortest paths")
+        return all_pairs_algorithm(self.freeze())
+
+    def preprocess_ch(self, ch: Optional[ContractionHierarchy] = None) -> ContractionHierarchy:
+        """Contraction hierarchy used by AlgorithmEnum.CH.
+
+        Built once per graph version. A hierarchy loaded with
+        ContractionHierarchy.read_from_json_file can be passed to skip the
+        preprocessing; it must come from this graph.
+        """
+        if ch is not None:
+            if ch.graph is not self:
+                raise LibgraphyError("Contraction hierarchy built for another graph")
+            self.__ch = (self._generation(), ch)
+            return ch
+
+        try:
+            generation, ch = self.__ch
+        except AttributeError: # never built or restored by jsonpickle
+            generation = None
+        if generation != self._generation():
+            ch = ContractionHierarchy(self._frozen())
+            self.__ch = (self._generation(), ch)
+        return cast(ContractionHierarchy, ch)
+
+    def freeze(self) -> FrozenGraph:
+        return FrozenGraph(self)
+
+    def _frozen(self) -> FrozenGraph:
+        # Snapshot every path algorithm runs on, rebuilt after every change to the graph
+        try:
+            generation, fg = self.__frozen
+        except AttributeError: # never built or restored by jsonpickle
+            generation = None
+        if generation != self._generation():
+            fg = FrozenGraph(self)
+            self.__frozen = (self._generation(), fg)
+        return cast(FrozenGraph, fg)
+
+    def __built_components(self) -> Optional[Dict[Vertex, int]]:
+        try:
+            generation, labels = self.__components
+        except AttributeError: # never computed or restored by jsonpickle
+            return None
+        return labels if generation == self._generation() else None
+
+    def _scc_labels(self) -> Dict[Vertex, int]:
+        labels: Optional[Dict[Vertex, int]] = self.__built_components()
+        if labels is None:
+            labels = _Components.strongly_connected(self.vertices)
+            self.__components = (self._generation(), labels)
+        return labels
+
+    def strongly_connected_components(self) -> list[list[Vertex]]:
+        """Strongly connected components, in reverse topological order of the condensation"""
+        labels: Dict[Vertex, int] = self._scc_labels()
+        components: list[list[Vertex]] = [[] for _ in range(len(set(labels.values())))]
+        for v in self.vertices:
+            components[labels[v]].append(v)
+        return [c for c in components if c]
+
+    def connected_components(self, weak: bool = True) -> list[list[Vertex]]:
+        """Weakly (edge directions ignored) or strongly connected components"""
+        if not weak:
+            return self.strongly_connected_components()
+
+        labels: list[int] = _Components.weakly_connected(self.vertices, self.edges)
+        components: list[list[Vertex]] = [[] for _ in range(max(labels, default=-1) + 1)]
+        for v, label in zip(self.vertices, labels):
+            components[label].append(v)
+        return components
+
+    def topological_order(self) -> Iterator[Vertex]:
+        """Vertices ordered so that every edge goes from an earlier vertex to a later one.
+
+        Kahn's algorithm, O(V+E) and iterative. Each vertex is yielded as soon
+        as all its predecessors were, so a caller may stop early. Raises
+        LibgraphyError once the remaining vertices turn out to be on or behind a cycle.
+        """
+        in_degree: Dict[Vertex, int] = {v: 0 for v in self.vertices}
+        for v in self.vertices:
+            for e in v.adjacent_edges:
+                if e.successor in in_degree:
+                    in_degree[e.successor] += 1
+
+        queue: Deque[Vertex] = deque(v for v in self.vertices if in_degree[v] == 0)
+        ordered: int = 0
+
+        while queue:
+            v: Vertex = queue.popleft()
+            ordered += 1
+            yield v
+
+            for e in v.adjacent_edges:
+                s: Vertex = e.successor
+                if s not in in_degree:
+                    continue
+                in_degree[s] -= 1
+                if in_degree[s] == 0:
+                    queue.append(s)
+
+        if ordered < len(in_degree):
+            raise LibgraphyError("Cycle found!")
+
+    def condensation(self) -> Graph:
+        """DAG of the strongly connected components.
+
+        The i-th vertex stands for the i-th component of strongly_connected_components()
+        and holds its vertices as value. An edge between two components carries
+        the smallest value of the edges joining them.
+        """
+        components: list[list[Vertex]] = self.strongly_connected_components()
+        labels: Dict[Vertex, int] = self._scc_labels()
+
+        dag: Graph = Graph()
+        component_vertices: Dict[int, Vertex] = {}
+        for i, c in enumerate(components):
+            v = Vertex(i, c)
+            dag += v
+            component_vertices[labels[c[0]]] = v
+
+        for e in self.edges:
+            p: Vertex = component_vertices[labels[e.predecessor]]
+            s: Vertex = component_vertices[labels[e.successor]]
+            if p is s:
+                continue
+            ce: Optional[Edge] = dag.edges[(p, s)]
+            if ce is None:
+                dag += Edge(p, s, e.value)
+            elif e.value < ce.value:
+                ce.value = e.value
+
+        return dag
+
     def incidence(self, weighted: bool):
         # TODO
         pass
@@ -550,26 +906,76 @@ class Graph:
 
         return g
 
+    def _generation(self) -> int:
+        try:
+            return self.__generation
+        except AttributeError: # restored by jsonpickle
+            return 0
+
+    def _touch(self) -> None:
+        # Called on every structural or weight change, outdates the cached traits
+        self.__generation = self._generation() + 1
+
+    def __built_counters(self) -> Optional[_TraitCounters]:
+        try:
+            return self.__counters
+        except AttributeError: # restored by jsonpickle
+            return None
+
+    def _trait_counters(self) -> _TraitCounters:
+        counters = self.__built_counters()
+        if counters is None:
+            counters = self.__counters = _TraitCounters(self.edges)
+        return counters
+
+    # Hooks called by the edge list and the edges of the graph
+
+    def _edge_added(self, e: Edge) -> None:
+        self._touch()
+        counters = self.__built_counters()
+        if counters is not None:
+            counters.add(e)
+
+    def _edge_removed(self, e: Edge) -> None:
+        self._touch()
+        counters = self.__built_counters()
+        if counters is not None:
+            counters.discard(e)
+
+    def _edge_reweighted(self, e: Edge, old: Any) -> None:
+        self._touch()
+        counters = self.__built_counters()
+        if counters is not None and e in self.edges:
+            counters.reweight(old, e.value)
+
+    def _edge_reversed(self, e: Edge, old_predecessor: Vertex) -> None:
+        self._touch()
+        counters = self.__built_counters()
+        if counters is not None:
+            counters.reverse(e, old_predecessor)
+
+    def _edges_reset(self) -> None:
+        self._touch()
+        self.__counters = None
+
     def traits(self) -> Graph.Traits:
-        gt: Graph.Traits = Graph.Traits(self)
-        gt.check_if_grid()
-        gt.get_grid_level()
-        gt.check_if_negative_edges()
-        gt.check_if_has_cycles()
-        gt.check_if_full()
-        gt.check_if_empty()
-        gt.check_if_connected()
+        try:
+            gt: Optional[Graph.Traits] = self.__traits
+        except AttributeError:
+            gt = None
+
+        if gt is None or gt.generation != self._generation():
+            gt = Graph.Traits(self, lazy=True)
+            self.__traits = gt
 
         return gt
 
     def trim_vertices(self) -> Graph:
         # Find all destination vertices
-        used = []
+        used: set[Vertex] = set()
         for e in self.edges:
-            if e.predecessor not in used:
-                used.append(e.predecessor)
-            if e.successor not in used:
-                used.append(e.successor)
+            used.add(e.predecessor)
+            used.add(e.successor)
 
         self.vertices = [v for v in self.vertices if v in used]
         return self
@@ -600,7 +1006,22 @@ class Graph:
             for e in self.edges:
                 e.value = value
         else:
+            # Keep the lookup indices for plain lists too
+            if key == "edges" and not isinstance(value, _EdgeList):
+                edges: _EdgeList = _EdgeList()
+                edges.extend(value)
+                value = edges
+            elif key == "vertices" and not isinstance(value, _VertexList):
+                vertices: _VertexList = _VertexList()
+                vertices.extend(value)
+                value = vertices
             super(Graph, self).__setattr__(key, value)
+            if key == "edges":
+                value.graph = self
+                self._edges_reset()
+            elif key == "vertices":
+                value.graph = self
+                self._touch()
             
     def to_undirected(self, mode: EdgeOverrideMode = EdgeOverrideMode.AVERAGE) -> Graph:
         g_copy = deepcopy(self)
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
-__all__ = ["Heuristic", "ManhattanDistance", "HexagonalManhattanDistance", "ChebyshevDistance"]
+__all__ = ["Heuristic", "ManhattanDistance", "HexagonalManhattanDistance", "ChebyshevDistance", "LandmarkHeuristic", "LandmarkSelection", "_HeuristicCache"]
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 if TYPE_CHECKING:
     from .vertex import Vertex
     from .graph import Graph
 
+from array import array
+from enum import Enum, auto
+from heapq import heappush, heappop
+from math import atan2, hypot, pi
+
+from .exception import LibgraphyError
+
 INFINITY = float("inf")
 
 class Heuristic:
     def evaluate(self, v1: Vertex, v2: Vertex, g: Graph):
-        for e in g.edges:
-            if e.predecessor == v1 and e.successor == v2:
-                return e.value
+        # No estimate: a lower bound of every distance, so A* runs as Dijkstra
         return 0
 
+class _HeuristicCache(dict):
+    """Memoised heuristic values towards the goal of a single A* query.
+
+    Each vertex is evaluated on first access only, later accesses are plain dict lookups.
+    """
+
+    def __init__(self, h: Heuristic, goal: Vertex, g: Graph) -> None:
+        super().__init__()
+        self.h: Heuristic = h
+        self.goal: Vertex = goal
+        self.graph: Graph = g
+
+    def __missing__(self, v: Vertex) -> float:
+        value = self[v] = self.h.evaluate(v, self.goal, self.graph)
+        return value
+
 class ManhattanDistance(Heuristic):
     def evaluate(self, v1: Vertex, v2: Vertex, g: Graph):
         if None in [v1.x, v1.y, v2.x, v2.y]:
@@ -44,3 +65,121 @@ class ChebyshevDistance(Heuristic):
             return INFINITY
 
         return max(abs(v2.x - v1.x), abs(v2.y - v1.y))
+
+class LandmarkSelection(Enum):
+    FARTHEST = auto()
+    PLANAR = auto()
+
+class LandmarkHeuristic(Heuristic):
+    """ALT heuristic: lower bounds from precomputed landmark distances.
+
+    For every landmark L the distances d(L, v) and d(v, L) to and from all
+    vertices are stored, and the triangle inequality gives
+    d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)) in O(k) per
+    evaluation, without vertex coordinates. FARTHEST picks each landmark as
+    far as possible from the previous ones, PLANAR the outermost vertex of k
+    sectors around the center of the vertex coordinates. Edge values must be
+    non-negative, and the tables must be rebuilt after the graph changes.
+    """
+
+    def __init__(self, g: Graph, k: int = 8, selection: LandmarkSelection = LandmarkSelection.FARTHEST) -> None:
+        if any(e.value < 0 for e in g.edges):
+            raise LibgraphyError("Landmarks need non-negative edge values")
+
+        self.graph: Graph = g
+        self.generation: int = g._generation()
+        self.indices: Dict[Vertex, int] = {v: i for i, v in enumerate(g.vertices)}
+
+        self.landmarks: list[Vertex] = []
+        # forward[i][v]: d(i-th landmark, v), backward[i][v]: d(v, i-th landmark)
+        self.forward: list[array[float]] = []
+        self.backward: list[array[float]] = []
+
+        if selection == LandmarkSelection.PLANAR:
+            for landmark in self.__planar(k):
+                self.__add(landmark)
+        else:
+            self.__add_farthest(k)
+
+    def __distances(self, landmark: Vertex, backward: bool) -> array[float]:
+        # Dijkstra from the landmark, along the edges or against them
+        distance: array[float] = array('d', [INFINITY]) * len(self.indices)
+        distance[self.indices[landmark]] = 0
+        heap: list[tuple[float, int, Vertex]] = [(0, self.indices[landmark], landmark)]
+
+        while heap:
+            d, i, v = heappop(heap)
+            if d > distance[i]:
+                continue
+            edges = self.graph.edges._incoming(v) if backward else v.adjacent_edges
+            for e in edges:
+                u: Vertex = e.predecessor if backward else e.successor
+                j = self.indices.get(u)
+                if j is not None and d + e.value < distance[j]:
+                    distance[j] = d + e.value
+                    heappush(heap, (distance[j], j, u))
+
+        return distance
+
+    def __add(self, landmark: Vertex) -> None:
+        self.landmarks.append(landmark)
+        self.forward.append(self.__distances(landmark, False))
+        self.backward.append(self.__distances(landmark, True))
+
+    def __add_farthest(self, k: int) -> None:
+        vertices: list[Vertex] = [* self.indices]
+        if not vertices or k < 1:
+            return
+
+        # Farthest vertex from an arbitrary one, then the farthest from all landmarks
+        # so far. Unreachable vertices count as the farthest, to cover every component.
+        nearest: list[float] = [* self.__distances(vertices[0], False)]
+        while len(self.landmarks) < k:
+            i: int = max(range(len(vertices)), key=nearest.__getitem__)
+            if nearest[i] == 0:
+                break # Every vertex is a landmark already
+            self.__add(vertices[i])
+            nearest = [min(a, b) for a, b in zip(nearest, self.forward[-1])]
+
+    def __planar(self, k: int) -> list[Vertex]:
+        vertices: list[Vertex] = [* self.indices]
+        if any(v.x is None or v.y is None for v in vertices):
+            raise LibgraphyError("Planar landmark selection needs vertex coordinates")
+        if not vertices or k < 1:
+            return []
+
+        cx: float = sum(v.x for v in vertices) / len(vertices)
+        cy: float = sum(v.y for v in vertices) / len(vertices)
+
+        # Outermost vertex of each of k equal sectors around the center
+        outermost: Dict[int, Vertex] = {}
+        for v in vertices:
+            sector: int = int(k * (atan2(v.y - cy, v.x - cx) + pi) / (2 * pi)) % k
+            o = outermost.get(sector)
+            if o is None or hypot(v.x - cx, v.y - cy) > hypot(o.x - cx, o.y - cy):
+                outermost[sector] = v
+
+        return [outermost[sector] for sector in sorted(outermost)]
+
+    def evaluate(self, v1: Vertex, v2: Vertex, g: Graph) -> float:
+        if g is not self.graph or g._generation() != self.generation:
+            raise LibgraphyError("Landmark tables are out of date, build a new LandmarkHeuristic")
+
+        i, j = self.indices.get(v1), self.indices.get(v2)
+        if i is None or j is None:
+            return 0
+
+        bound: float = 0
+        for forward, backward in zip(self.forward, self.backward):
+            # d(L, t) - d(L, v): L reaching v but not t means t is unreachable from v
+            if forward[i] != INFINITY:
+                if forward[j] == INFINITY:
+                    return INFINITY
+                bound = max(bound, forward[j] - forward[i])
+            # d(v, L) - d(t, L): t reaching L but not v means the same
+            if backward[j] != INFINITY:
+                if backward[i] == INFINITY:
+                    return INFINITY
+                bound = max(bound, backward[i] - backward[j])
+
+        return bound
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+__all__ = ["ImplicitGridGraph"]
+
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, NamedTuple, Optional
+if TYPE_CHECKING: # pragma: no cover
+    from .graph import Graph
+
+from array import array
+from heapq import heappush, heappop
+
+from .algorithm import AlgorithmEnum
+from .edge import Edge
+from .exception import LibgraphyError
+from .heuristic import Heuristic, LandmarkHeuristic
+from .jps import _ImplicitGrid, _JumpPointGrid, STRAIGHT_DIRECTIONS, DIAGONAL_DIRECTIONS
+from .path import Path
+from .vertex import Vertex
+
+INFINITY = float("inf")
+
+class _Point(NamedTuple):
+    # Stands in for a Vertex when a heuristic is evaluated on a cell
+    x: int
+    y: int
+
+class ImplicitGridGraph:
+    """Grid of width x height cells whose edges are never stored.
+
+    Blocked cells are kept in one bitmap per row (an int whose bit x is set
+    when cell x of that row is blocked) and cells may have a cost, stored row
+    by row. Moving into a cell is worth its cost (1 without costs), times
+    diagonal_cost for a diagonal move; diagonal moves may cut past blocked
+    corners, like the diagonal edges of GraphFactory.square_grid.
+    Neighbors are computed from the cell position, Vertex and Edge objects are
+    only created for the returned paths. Vertices given to find_path only need
+    their x and y coordinates.
+    """
+
+    def __init__(self, width: int, height: int, diagonals: bool = True, diagonal_cost: float = 1,
+                 blocked: Iterable[tuple[int, int]] = (), costs: Optional[Iterable[float]] = None) -> None:
+        if width < 1 or height < 1:
+            raise LibgraphyError(f"Cannot create grid with ({width}, {height}) dimensions")
+        if not 1 <= diagonal_cost <= 2:
+            raise LibgraphyError("Diagonal moves must be worth one to two straight ones")
+
+        self.width: int = width
+        self.height: int = height
+        self.diagonals: bool = diagonals
+        self.diagonal_cost: float = diagonal_cost
+        self.directions: tuple[tuple[int, int], ...] = STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS if diagonals else STRAIGHT_DIRECTIONS
+
+        self.__rows: list[int] = [0] * height
+        for x, y in blocked:
+            self.block(x, y)
+
+        self.costs: Optional[array[float]] = None
+        if costs is not None:
+            self.costs = array('d', costs)
+            if len(self.costs) != width * height:
+                raise LibgraphyError(f"Expected {width * height} cell costs, got {len(self.costs)}")
+            if any(c < 0 for c in self.costs):
+                raise LibgraphyError("Cell costs must not be negative")
+
+        # Built on the first JPS query, dropped when cells are (un)blocked
+        self.__jps: Optional[_ImplicitGrid] = None
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __repr__(self) -> str:
+        return f"ImplicitGridGraph: {self.width}x{self.height} cells, {self.blocked_count()} blocked"
+
+    def __index(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise LibgraphyError(f"Cell ({x},{y}) is out of the grid")
+        return y * self.width + x
+
+    def _is_open(self, x: int, y: int) -> bool:
+        # On the grid and not blocked
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return not self.__rows[y] >> x & 1
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        self.__index(x, y)
+        return bool(self.__rows[y] >> x & 1)
+
+    def block(self, x: int, y: int) -> None:
+        self.__index(x, y)
+        self.__rows[y] |= 1 << x
+        self.__jps = None
+
+    def unblock(self, x: int, y: int) -> None:
+        self.__index(x, y)
+        self.__rows[y] &= ~(1 << x)
+        self.__jps = None
+
+    def blocked_count(self) -> int:
+        return sum(row.bit_count() for row in self.__rows)
+
+    def _blocked_rows(self) -> list[int]:
+        return self.__rows
+
+    def cost(self, x: int, y: int) -> float:
+        i: int = self.__index(x, y)
+        return 1 if self.costs is None else self.costs[i]
+
+    def nbytes(self) -> int:
+        """Memory used by the blocked bitmap and the cell costs"""
+        return self.height * ((self.width + 7) // 8) + (0 if self.costs is None else self.costs.itemsize * len(self.costs))
+
+    def vertex(self, x: int, y: int) -> Vertex:
+        """New Vertex for a cell, named like the vertices of GraphFactory.square_grid"""
+        self.__index(x, y)
+        return Vertex(f"({x},{y})", x=x, y=y)
+
+    def __neighbors(self, i: int) -> Iterator[tuple[int, float]]:
+        # Open neighbors of the i-th cell and the value of the move into them
+        y, x = divmod(i, self.width)
+        for dx, dy in self.directions:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                if not self.__rows[ny] >> nx & 1:
+                    j: int = ny * self.width + nx
+                    cost: float = 1 if self.costs is None else self.costs[j]
+                    yield j, cost * self.diagonal_cost if dx and dy else cost
+
+    def __estimate(self, goal: int) -> Callable[[int], float]:
+        # Octile distance times the cheapest cell cost, a consistent lower bound
+        gy, gx = divmod(goal, self.width)
+        scale: float = 1 if self.costs is None else min(self.costs)
+
+        def estimate(i: int) -> float:
+            y, x = divmod(i, self.width)
+            dx, dy = abs(gx - x), abs(gy - y)
+            if not self.diagonals:
+                return scale * (dx + dy)
+            return scale * (self.diagonal_cost * min(dx, dy) + abs(dx - dy))
+
+        return estimate
+
+    def __heuristic(self, h: Heuristic, goal: int) -> Callable[[int], float]:
+        if isinstance(h, LandmarkHeuristic):
+            raise LibgraphyError("Landmark tables are built on a Graph, not on an implicit grid")
+        if type(h) is Heuristic:
+            return lambda i: 0
+
+        gy, gx = divmod(goal, self.width)
+        target: _Point = _Point(gx, gy)
+
+        def estimate(i: int) -> float:
+            y, x = divmod(i, self.width)
+            return h.evaluate(_Point(x, y), target, self)
+
+        return estimate
+
+    def __a_star(self, start: int, goal: int, estimate: Callable[[int], float]) -> tuple[list[int], float, int]:
+        distance_from_start: Dict[int, float] = {start: 0}
+        previous: Dict[int, int] = {start: -1}
+        closed: set[int] = set()
+
+        # Ordered by f = g + h, ties prefer the larger g; cells compare as integers
+        heap: list[tuple[float, float, int]] = [(estimate(start), 0, start)]
+
+        while heap:
+            _, distance, i = heappop(heap)
+            if i in closed:
+                continue
+            closed.add(i)
+
+            if i == goal:
+                break
+
+            distance = -distance
+            for j, value in self.__neighbors(i):
+                if j in closed:
+                    continue
+                new_path: float = distance + value
+                if new_path < distance_from_start.get(j, INFINITY):
+                    distance_from_start[j] = new_path
+                    previous[j] = i
+                    heappush(heap, (new_path + estimate(j), -new_path, j))
+
+        if goal not in closed:
+            return [], INFINITY, len(closed)
+
+        cells: list[int] = []
+        while goal >= 0:
+            cells.append(goal)
+            goal = previous[goal]
+        cells.reverse()
+
+        return cells, distance_from_start[cells[-1]], len(closed)
+
+    def __jps_search(self, start: int, goal: int) -> tuple[list[int], float, int]:
+        if self.__jps is None:
+            self.__jps = _ImplicitGrid(self)
+
+        sy, sx = divmod(start, self.width)
+        gy, gx = divmod(goal, self.width)
+        jump_points, value, expanded = self.__jps._search((sx, sy), (gx, gy))
+
+        return [y * self.width + x for x, y in _JumpPointGrid._cells(jump_points)], value, expanded
+
+    def find_path(self, start: Vertex, end: Vertex, heuristic: Heuristic = Heuristic(), algorithm: AlgorithmEnum = AlgorithmEnum.BEST) -> Path:
+        s, t = self.__index(start.x, start.y), self.__index(end.x, end.y)
+
+        search: Callable[[], tuple[list[int], float, int]]
+        if algorithm == AlgorithmEnum.BEST and self.costs is None:
+            # Every move is uniform, JPS applies
+            search = lambda: self.__jps_search(s, t)
+        elif algorithm == AlgorithmEnum.BEST:
+            # A* guided by the given heuristic, or else by the grid's own bound
+            estimate = self.__estimate(t) if type(heuristic) is Heuristic else self.__heuristic(heuristic, t)
+            search = lambda: self.__a_star(s, t, estimate)
+        elif algorithm == AlgorithmEnum.DIJKSTRA:
+            search = lambda: self.__a_star(s, t, lambda i: 0)
+        elif algorithm == AlgorithmEnum.A_STAR:
+            estimate = self.__heuristic(heuristic, t)
+            search = lambda: self.__a_star(s, t, estimate)
+        elif algorithm == AlgorithmEnum.JPS:
+            search = lambda: self.__jps_search(s, t)
+        else:
+            raise LibgraphyError(f"{algorithm.name} is not supported on an implicit grid")
+
+        path: Path = Path(self)
+        if not self._is_open(start.x, start.y) or not self._is_open(end.x, end.y):
+            path.value = INFINITY
+            return path
+
+        cells, path.value, path.settled = search()
+        if len(cells) < 2:
+            return path
+
+        # Vertices of the path only, reusing the given endpoints
+        vertices: list[Vertex] = [start] + [self.vertex(i % self.width, i // self.width) for i in cells[1:-1]] + [end]
+        for u, v, i in zip(vertices, vertices[1:], cells[1:]):
+            cost: float = 1 if self.costs is None else self.costs[i]
+            path.edges.append(Edge(u, v, cost * self.diagonal_cost if u.x != v.x and u.y != v.y else cost))
+
+        return path
+
+    def to_graph(self) -> Graph:
+        """Materialized Graph with a vertex per open cell and an edge per move"""
+        from .graph import Graph
+
+        g: Graph = Graph()
+        vertices: Dict[int, Vertex] = {}
+        for i in range(len(self)):
+            y, x = divmod(i, self.width)
+            if self._is_open(x, y):
+                vertices[i] = self.vertex(x, y)
+                g += vertices[i]
+
+        for i, u in vertices.items():
+            for j, value in self.__neighbors(i):
+                g += Edge(u, vertices[j], value)
+
+        return g
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+__all__ = ["_JumpPointGrid", "_GraphGrid", "_ImplicitGrid"]
+
+from typing import TYPE_CHECKING, Dict, Optional
+if TYPE_CHECKING: # pragma: no cover
+    from .frozengraph import FrozenGraph
+    from .vertex import Vertex
+    from .implicitgrid import ImplicitGridGraph
+
+from abc import ABC, abstractmethod
+from heapq import heappush, heappop
+from itertools import count
+
+from .exception import LibgraphyError
+from .path import Path
+
+INFINITY = float("inf")
+
+type _Cell = tuple[int, int]
+type _Direction = tuple[int, int]
+
+STRAIGHT_DIRECTIONS: tuple[_Direction, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL_DIRECTIONS: tuple[_Direction, ...] = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+def _sign(n: int) -> int:
+    return (n > 0) - (n < 0)
+
+class _JumpPointGrid(ABC):
+    """Jump point search over the cells of a 4- or 8-connected grid.
+
+    Every straight move costs the same and so does every diagonal one,
+    between one and two straight moves. Shortest paths are made canonical
+    (diagonal moves before straight ones, or horizontal before vertical
+    ones without diagonals), so a search only follows canonical successors
+    and jumps over the cells in between. A cell is regular when it and the
+    cells around it can move in every direction that stays on the grid;
+    jumps stop at irregular cells, which are expanded in every direction.
+    Subclasses tell which cells are on the grid and which moves exist, and
+    may stop jumps at fewer cells when they know where obstacles are.
+    """
+
+    def __init__(self, diagonals: bool, straight: float, diagonal: float) -> None:
+        self.diagonals: bool = diagonals
+        self.straight: float = straight
+        self.diagonal: float = diagonal
+        self.directions: tuple[_Direction, ...] = STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS if diagonals else STRAIGHT_DIRECTIONS
+
+        self.__complete: Dict[_Cell, bool] = {}
+        self.__regular: Dict[_Cell, bool] = {}
+        # Where a straight run from each scanned cell stops, see _straight
+        self.__stops: Dict[_Direction, Dict[_Cell, tuple[_Cell, bool]]] = {d: {} for d in STRAIGHT_DIRECTIONS}
+
+    @abstractmethod
+    def _on_grid(self, x: int, y: int) -> bool:
+        ...
+
+    @abstractmethod
+    def _can_move(self, x: int, y: int, dx: int, dy: int) -> bool:
+        ...
+
+    def _forget(self) -> None:
+        # Moves have changed, regular cells must be found again
+        self.__complete.clear()
+        self.__regular.clear()
+        for stops in self.__stops.values():
+            stops.clear()
+
+    def __is_complete(self, x: int, y: int) -> bool:
+        complete: Optional[bool] = self.__complete.get((x, y))
+        if complete is None:
+            complete = self.__complete[(x, y)] = all(self._can_move(x, y, dx, dy)
+                                                     for dx, dy in self.directions if self._on_grid(x + dx, y + dy))
+        return complete
+
+    def _is_regular(self, x: int, y: int) -> bool:
+        regular: Optional[bool] = self.__regular.get((x, y))
+        if regular is None:
+            regular = self.__regular[(x, y)] = all(self.__is_complete(x + i, y + j)
+                                                   for i in (-1, 0, 1) for j in (-1, 0, 1) if self._on_grid(x + i, y + j))
+        return regular
+
+    def _forced(self, x: int, y: int, dx: int, dy: int) -> bool:
+        # Whether a cell reached by a move in (dx, dy) must be expanded in every direction
+        return not self._is_regular(x, y)
+
+    def _estimate(self, cell: _Cell, goal: _Cell) -> float:
+        # Exact distance on an empty grid, hence consistent
+        dx, dy = abs(goal[0] - cell[0]), abs(goal[1] - cell[1])
+        if not self.diagonals:
+            return self.straight * (dx + dy)
+        return self.diagonal * min(dx, dy) + self.straight * abs(dx - dy)
+
+    def __branches(self, dx: int, dy: int) -> tuple[_Direction, ...]:
+        # Canonical turns that may be taken after every move in (dx, dy)
+        if self.diagonals:
+            return ((dx, 0), (0, dy)) if dx and dy else ()
+        return ((0, 1), (0, -1)) if dx else ()
+
+    def _straight(self, x: int, y: int, dx: int, dy: int) -> tuple[_Cell, bool]:
+        # First forced cell after (x, y) in a straight direction (True), or the
+        # last cell before the run is blocked (False). Every cell walked over
+        # shares the answer, so each run is scanned once.
+        stops: Dict[_Cell, tuple[_Cell, bool]] = self.__stops[(dx, dy)]
+        walked: list[_Cell] = []
+        while True:
+            stop: Optional[tuple[_Cell, bool]] = stops.get((x, y))
+            if stop is not None:
+                break
+            walked.append((x, y))
+            if not self._can_move(x, y, dx, dy):
+                stop = ((x, y), False)
+                break
+            x += dx
+            y += dy
+            if self._forced(x, y, dx, dy):
+                stop = ((x, y), True)
+                break
+
+        for cell in walked:
+            stops[cell] = stop
+        return stop
+
+    def __straight_jump(self, x: int, y: int, dx: int, dy: int, goal: _Cell) -> Optional[_Cell]:
+        end, forced = self._straight(x, y, dx, dy)
+        # Goal on the run, between (x, y) excluded and its end included
+        if (goal[1] == y if dx else goal[0] == x) and 0 < (goal[0] - x) * dx + (goal[1] - y) * dy <= (end[0] - x) * dx + (end[1] - y) * dy:
+            return goal
+        return end if forced else None
+
+    def __jump(self, x: int, y: int, dx: int, dy: int, goal: _Cell) -> Optional[_Cell]:
+        branches: tuple[_Direction, ...] = self.__branches(dx, dy)
+        if not branches:
+            return self.__straight_jump(x, y, dx, dy, goal)
+
+        while self._can_move(x, y, dx, dy):
+            x += dx
+            y += dy
+            if (x, y) == goal or self._forced(x, y, dx, dy):
+                return (x, y)
+            for bx, by in branches:
+                if self.__straight_jump(x, y, bx, by, goal) is not None:
+                    return (x, y)
+        return None
+
+    def __successors(self, cell: _Cell, parent: Optional[_Cell]) -> tuple[_Direction, ...]:
+        if parent is None:
+            return self.directions
+        x, y = cell
+        dx, dy = _sign(x - parent[0]), _sign(y - parent[1])
+        if self._forced(x, y, dx, dy):
+            return self.directions
+        return ((dx, dy),) + self.__branches(dx, dy)
+
+    def _search(self, start: _Cell, goal: _Cell) -> tuple[list[_Cell], float, int]:
+        """Jump points from start to goal (none if unreachable), the path value and the number of expanded cells"""
+        distance_from_start: Dict[_Cell, float] = {start: 0}
+        parent: Dict[_Cell, Optional[_Cell]] = {start: None}
+        closed: set[_Cell] = set()
+
+        # Same open set as A*: ordered by f = g + h, ties prefer the larger g
+        counter = count()
+        heap: list[tuple[float, float, int, _Cell]] = [(self._estimate(start, goal), 0, next(counter), start)]
+
+        while heap:
+            _, _, _, cell = heappop(heap)
+            if cell in closed:
+                continue
+            closed.add(cell)
+
+            if cell == goal:
+                break
+
+            distance: float = distance_from_start[cell]
+            for dx, dy in self.__successors(cell, parent[cell]):
+                jump_point: Optional[_Cell] = self.__jump(cell[0], cell[1], dx, dy, goal)
+                if jump_point is None or jump_point in closed:
+                    continue
+
+                steps: int = max(abs(jump_point[0] - cell[0]), abs(jump_point[1] - cell[1]))
+                new_path: float = distance + steps * (self.diagonal if dx and dy else self.straight)
+                if new_path < distance_from_start.get(jump_point, INFINITY):
+                    distance_from_start[jump_point] = new_path
+                    parent[jump_point] = cell
+                    heappush(heap, (new_path + self._estimate(jump_point, goal), -new_path, next(counter), jump_point))
+
+        if goal not in closed:
+            return [], INFINITY, len(closed)
+
+        jump_points: list[_Cell] = []
+        c: Optional[_Cell] = goal
+        while c is not None:
+            jump_points.append(c)
+            c = parent[c]
+        jump_points.reverse()
+
+        return jump_points, distance_from_start[goal], len(closed)
+
+    @staticmethod
+    def _cells(jump_points: list[_Cell]) -> list[_Cell]:
+        """Every cell of the path through the jump points"""
+        cells: list[_Cell] = jump_points[:1]
+        for (x, y), (jx, jy) in zip(jump_points, jump_points[1:]):
+            dx, dy = _sign(jx - x), _sign(jy - y)
+            while (x, y) != (jx, jy):
+                x += dx
+                y += dy
+                cells.append((x, y))
+        return cells
+
+class _GraphGrid(_JumpPointGrid):
+    """Grid of a graph snapshot whose vertices sit on distinct cells (Vertex.x,
+    Vertex.y) and whose edges join neighboring cells. Obstacles are missing
+    vertices or edges.
+    """
+
+    def __init__(self, fg: FrozenGraph) -> None:
+        self.fg: FrozenGraph = fg
+        self.vertices: Dict[_Cell, Vertex] = {}
+
+        for v in fg.vertices:
+            if not isinstance(v.x, int) or not isinstance(v.y, int):
+                raise LibgraphyError(f"Vertex {v} has no integer coordinates")
+            other: Optional[Vertex] = self.vertices.setdefault((v.x, v.y), v)
+            if other is not v:
+                raise LibgraphyError(f"Vertices {other} and {v} are on the same cell")
+
+        # Cells that can move in each direction
+        self.__moves: Dict[_Direction, set[_Cell]] = {d: set() for d in STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS}
+        straight: set[float] = set()
+        diagonal: set[float] = set()
+
+        for i, u in enumerate(fg.vertices):
+            for k in range(fg.offsets[i], fg.offsets[i+1]):
+                s: Vertex = fg.vertices[fg.targets[k]]
+                moves: Optional[set[_Cell]] = self.__moves.get((s.x - u.x, s.y - u.y))
+                if moves is None:
+                    raise LibgraphyError(f"Edge ({u}->{s}) does not join neighboring cells")
+                moves.add((u.x, u.y))
+                (diagonal if u.x != s.x and u.y != s.y else straight).add(fg.weights[k])
+
+        if len(straight) > 1 or len(diagonal) > 1:
+            raise LibgraphyError("JPS needs the same value on every straight and on every diagonal edge")
+        straight_value: float = next(iter(straight), 1)
+        diagonal_value: float = next(iter(diagonal), straight_value)
+        if not 0 <= straight_value <= diagonal_value <= 2 * straight_value:
+            raise LibgraphyError("JPS needs diagonal edges worth one to two straight ones")
+
+        super().__init__(len(diagonal) > 0, straight_value, diagonal_value)
+
+        xs: list[int] = [x for x, _ in self.vertices]
+        ys: list[int] = [y for _, y in self.vertices]
+        self.__bounds: tuple[int, int, int, int] = (min(xs, default=0), max(xs, default=-1), min(ys, default=0), max(ys, default=-1))
+
+    def _on_grid(self, x: int, y: int) -> bool:
+        min_x, max_x, min_y, max_y = self.__bounds
+        return min_x <= x <= max_x and min_y <= y <= max_y
+
+    def _can_move(self, x: int, y: int, dx: int, dy: int) -> bool:
+        return (x, y) in self.__moves[(dx, dy)]
+
+    def __cell(self, vertex: Vertex) -> _Cell:
+        cell: _Cell = (vertex.x, vertex.y)
+        if self.vertices.get(cell) is not vertex:
+            raise LibgraphyError(f"Vertex {vertex} does not belong to the grid")
+        return cell
+
+    def find_path(self, start: Vertex, end: Vertex) -> Path:
+        jump_points, value, expanded = self._search(self.__cell(start), self.__cell(end))
+
+        path: Path = Path(self.fg.graph)
+        path.value = self.fg._value(value)
+        path.settled = expanded
+
+        indices: list[int] = [self.fg.indices[self.vertices[c]] for c in _JumpPointGrid._cells(jump_points)]
+        # Any of parallel edges will do, they are all worth the same
+        path.edges = [self.fg.edges[self.fg._position(u, s)] for u, s in zip(indices, indices[1:])]
+
+        return path
+
+class _ImplicitGrid(_JumpPointGrid):
+    """Cells of an ImplicitGridGraph, obstacles are its blocked cells.
+
+    Every move between open cells exists, so jumps only stop at cells with
+    forced neighbors: a canonical path around them is cut by a blocked cell.
+    Straight runs are read from the blocked bitmaps of rows and columns.
+    """
+
+    def __init__(self, graph: ImplicitGridGraph) -> None:
+        if graph.costs is not None:
+            raise LibgraphyError("JPS needs a grid without cell costs")
+        super().__init__(graph.diagonals, 1, graph.diagonal_cost)
+        self.graph: ImplicitGridGraph = graph
+        self.width: int = graph.width
+        self.height: int = graph.height
+
+        # Blocked bitmaps of every row (bit x) and every column (bit y)
+        self.rows: list[int] = graph._blocked_rows()
+        self.columns: list[int] = [0] * graph.width
+        for y, row in enumerate(self.rows):
+            while row:
+                low: int = row & -row
+                self.columns[low.bit_length() - 1] |= 1 << y
+                row ^= low
+
+    def _on_grid(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def _can_move(self, x: int, y: int, dx: int, dy: int) -> bool:
+        return self.graph._is_open(x, y) and self.graph._is_open(x + dx, y + dy)
+
+    def _forced(self, x: int, y: int, dx: int, dy: int) -> bool:
+        is_open = self.graph._is_open
+        if self.diagonals:
+            if dx and dy:
+                return (not is_open(x - dx, y) and is_open(x - dx, y + dy)) or (not is_open(x, y - dy) and is_open(x + dx, y - dy))
+            # Sides of a straight move
+            sx, sy = dy, dx
+            return any(not is_open(x + s * sx, y + s * sy) and is_open(x + s * sx + dx, y + s * sy + dy) for s in (1, -1))
+        # Horizontal moves come first, only vertical ones have forced neighbors
+        if dx:
+            return False
+        return any(not is_open(x + s, y - dy) and is_open(x + s, y) for s in (1, -1))
+
+    def __forced_line(self, lines: list[int], j: int, d: int, size: int) -> int:
+        # Bits of the cells of line j where a run in direction d has forced neighbors
+        full: int = (1 << size) - 1
+        forced: int = 0
+        for side in (j - 1, j + 1):
+            if not 0 <= side < len(lines):
+                continue
+            blocked: int = lines[side]
+            opened: int = ~blocked & full
+            if self.diagonals:
+                # Blocked beside the cell, open beside the next one
+                forced |= blocked & (opened >> 1 if d > 0 else opened << 1)
+            else:
+                # Open beside the cell, blocked beside the previous one
+                forced |= opened & (blocked << 1 if d > 0 else blocked >> 1)
+        return forced
+
+    @staticmethod
+    def __next(bits: int, i: int, d: int) -> Optional[int]:
+        # Position of the first set bit from i on, going up (d = 1) or down (d = -1)
+        if d > 0:
+            bits >>= max(i, 0)
+            return max(i, 0) + (bits & -bits).bit_length() - 1 if bits else None
+        bits &= (1 << (i + 1)) - 1 if i >= 0 else 0
+        return bits.bit_length() - 1 if bits else None
+
+    def _straight(self, x: int, y: int, dx: int, dy: int) -> tuple[_Cell, bool]:
+        if not self._can_move(x, y, dx, dy):
+            return (x, y), False
+
+        # Along a row or along a column, i is the position on it
+        lines, i, j, d, size = (self.rows, x, y, dx, self.width) if dx else (self.columns, y, x, dy, self.height)
+
+        # Last open cell before a blocked one or the border
+        blocked: Optional[int] = _ImplicitGrid.__next(lines[j], i + d, d)
+        end: int = (blocked if blocked is not None else (size if d > 0 else -1)) - d
+
+        forced: Optional[int] = _ImplicitGrid.__next(self.__forced_line(lines, j, d, size), i + d, d)
+        if forced is not None and (forced - end) * d <= 0:
+            return ((forced, y) if dx else (x, forced)), True
+
+        return ((end, y) if dx else (x, end)), False
@@ -28,6 +28,8 @@ class Path:
         self.graph: Graph = graph
         self.edges: list[Edge] = []
         self.value: int | float = 0
+        # Number of vertices settled by the search that found the path (None if not tracked)
+        self.settled: Optional[int] = None
 
     def __repr__(self) -> str:
         repr_txt = f"Path: {self.edges[0].predecessor}"
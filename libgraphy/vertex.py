@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-__all__ = ["Vertex"]
+__all__ = ["Vertex", "_VertexList"]
 
-from typing import Optional, Self, Any, Generator, TYPE_CHECKING
+from typing import Optional, Self, Any, Dict, Generator, Iterable, SupportsIndex, TYPE_CHECKING, override
 if TYPE_CHECKING: # pragma: no cover
     from .graph import Graph
     from .edge import Edge, _EdgeList
@@ -90,13 +90,17 @@ class Vertex:
         if self.graph is not None:
             raise LibgraphyError("Vertex already belongs to another graph")
 
+        # Vertices of g that were connected to self before it joined the graph
+        pending: list[Vertex] = g.vertices._pop_pending(self)
+
         g.vertices.append(self)
         self.graph = g
 
-        for v in g.vertices:
-            if v.isConnected(self):
+        for v in pending:
+            if v.graph is g and v.isConnected(self):
                 g._create_edge(v, self)
-            if self.isConnected(v):
+        for v in self.neighbors:
+            if v in g.vertices:
                 g._create_edge(self, v)
 
         return g
@@ -122,3 +126,163 @@ class Vertex:
 
     # ***************************
 
+class _VertexList(list):
+    # Like _EdgeList, the identity-based membership index lives in a slot, is
+    # built lazily and kept in sync by the mutating methods. Pending maps each
+    # vertex outside of the list to the member vertices which already count it
+    # among their neighbors, so that Graph += Vertex can wire its incoming
+    # edges without scanning the graph; None stands for a removed vertex whose
+    # referrers are only looked up if it joins again.
+    __slots__ = ("__index", "__pending", "__dict__")
+
+    def __init__(self, graph: Optional[Graph] = None) -> None:
+        super().__init__()
+        self.graph: Optional[Graph] = graph
+        self.__index: Optional[set[Vertex]] = None
+        self.__pending: Optional[Dict[Vertex, Optional[list[Vertex]]]] = None
+
+    def __built_index(self) -> Optional[set[Vertex]]:
+        try:
+            return self.__index
+        except AttributeError: # restored by jsonpickle
+            return None
+
+    def __built_pending(self) -> Optional[Dict[Vertex, Optional[list[Vertex]]]]:
+        try:
+            return self.__pending
+        except AttributeError: # restored by jsonpickle
+            return None
+
+    def _index(self) -> set[Vertex]:
+        index = self.__built_index()
+        if index is None:
+            index = set(self)
+            self.__index = index
+        return index
+
+    def __add_pending(self, pending: Dict[Vertex, Optional[list[Vertex]]], v: Vertex) -> None:
+        index = self._index()
+        for n in v.neighbors:
+            if n not in index:
+                referrers = pending.setdefault(n, [])
+                if referrers is not None:
+                    referrers.append(v)
+
+    def _pop_pending(self, vertex: Vertex) -> list[Vertex]:
+        pending = self.__built_pending()
+        if pending is None:
+            pending = {}
+            for v in self:
+                self.__add_pending(pending, v)
+            self.__pending = pending
+        referrers = pending.pop(vertex, [])
+        if referrers is None:
+            referrers = [v for v in self if v.isConnected(vertex)]
+        return referrers
+
+    def __added(self, vertices: list[Vertex]) -> None:
+        index = self.__built_index()
+        if index is not None:
+            index.update(vertices)
+
+        pending = self.__built_pending()
+        if pending is not None:
+            for v in vertices:
+                self.__add_pending(pending, v)
+
+    def __discarded(self, vertices: list[Vertex]) -> None:
+        index = self.__built_index()
+        if index is not None:
+            index.difference_update(vertices)
+
+        pending = self.__built_pending()
+        if pending is not None:
+            for v in vertices:
+                # v no longer links its outside neighbors into the graph
+                for n in v.neighbors:
+                    referrers = pending.get(n)
+                    if referrers:
+                        for i, u in enumerate(referrers):
+                            if u is v:
+                                del referrers[i]
+                                break
+                pending[v] = None
+
+    def __invalidate(self) -> None:
+        self.__index = None
+        self.__pending = None
+
+    def __changed(self) -> None:
+        # Only the vertex list of a graph counts as a change of that graph
+        graph: Optional[Graph] = self.__dict__.get("graph")
+        if graph is not None and graph.__dict__.get("vertices") is self:
+            graph._touch()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> _VertexList:
+        vertices = _VertexList()
+        memo[id(self)] = vertices
+        vertices.__dict__.update(deepcopy(self.__dict__, memo))
+        list.extend(vertices, (deepcopy(v, memo) for v in self))
+        return vertices
+
+    @override
+    def append(self, v: Vertex) -> None:
+        self.extend((v,))
+
+    @override
+    def extend(self, vertices: Iterable[Vertex]) -> None:
+        vertices = list(vertices)
+        super().extend(vertices)
+        self.__added(vertices)
+        self.__changed()
+
+    @override
+    def __iadd__(self, vertices: Iterable[Vertex]) -> Self:
+        self.extend(vertices)
+        return self
+
+    @override
+    def insert(self, i: SupportsIndex, v: Vertex) -> None:
+        super().insert(i, v)
+        self.__added([v])
+        self.__changed()
+
+    @override
+    def remove(self, v: Vertex) -> None:
+        super().remove(v)
+        self.__discarded([v])
+        self.__changed()
+
+    @override
+    def pop(self, i: SupportsIndex = -1) -> Vertex:
+        v: Vertex = super().pop(i)
+        self.__discarded([v])
+        self.__changed()
+        return v
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self.__invalidate()
+        self.__changed()
+
+    @override
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        removed: list[Vertex] = super().__getitem__(key) if isinstance(key, slice) else [super().__getitem__(key)]
+        super().__delitem__(key)
+        self.__discarded(removed)
+        self.__changed()
+
+    @override
+    def __setitem__(self, key: Any, value: Any) -> None:
+        removed: list[Vertex] = super().__getitem__(key) if isinstance(key, slice) else [super().__getitem__(key)]
+        added: list[Vertex] = list(value) if isinstance(key, slice) else [value]
+        super().__setitem__(key, added if isinstance(key, slice) else value)
+        self.__discarded(removed)
+        self.__added(added)
+        self.__changed()
+
+    @override
+    def __contains__(self, v: Any) -> bool:
+        return v in self._index()
+
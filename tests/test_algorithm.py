@@ -1,7 +1,10 @@
 import unittest
 import pytest
+from unittest import mock
 
 from libgraphy import *
+from libgraphy.algorithm import _Algorithm
+from libgraphy.jps import _JumpPointGrid
 from .utils import create_hexagonal_flat_graph, create_test_graph, create_grid_graph, create_octogonal_graph
 
 class TestAlgorithm(unittest.TestCase):
@@ -14,6 +17,93 @@ class TestAlgorithm(unittest.TestCase):
         assert path.edges == res_edges
         assert path.value == sum(e.value for e in res_edges)
 
+    def test_dijkstra_unreachable(self):
+        g = create_test_graph()
+        v = Vertex("u")
+        g += v
+
+        path: Path = g.find_path(g.vertices[0], v, algorithm = AlgorithmEnum.DIJKSTRA)
+        assert path.edges == []
+        assert path.value == float("inf")
+
+    def test_dijkstra_random(self):
+        g: Graph = GraphFactory.digraph(40, 200, weighted=True)
+        s = g.vertices[0]
+
+        for t in g.vertices[1:]:
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+            expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD)
+            assert path.value == pytest.approx(expected.value)
+            if path.edges:
+                assert path.value == pytest.approx(sum(e.value for e in path.edges))
+
+    def test_bidirectional_dijkstra(self):
+        g: Graph = GraphFactory.digraph(40, 200, weighted=True)
+
+        for s in g.vertices[:5]:
+            for t in g.vertices:
+                path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA)
+                expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                assert path.value == pytest.approx(expected.value)
+                if path.edges:
+                    assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+                    assert all(a.successor is b.predecessor for a, b in zip(path.edges, path.edges[1:]))
+                    assert path.value == pytest.approx(sum(e.value for e in path.edges))
+                else:
+                    assert s is t or path.value == float("inf")
+
+    def test_bidirectional_dijkstra_settled(self):
+        g: Graph = create_grid_graph(20, 20)
+        s, t = g.vertices[0], g.vertices[-1]
+
+        path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA)
+        expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+        assert path.value == expected.value
+        assert path.settled <= expected.settled
+
+        v = Vertex("u")
+        g += v
+        path: Path = g.find_path(s, v, algorithm = AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA)
+        assert path.edges == [] and path.value == float("inf")
+
+    def test_tree_targets(self):
+        g: Graph = create_grid_graph(20, 20)
+        for i, e in enumerate(g.edges):
+            e.value = i % 4
+        s = g.vertices[0]
+        targets = [g.vertices[1], g.vertices[21], g.vertices[40]]
+        full: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+
+        for tree_algorithm in [_Algorithm.dijkstra_tree, _Algorithm.bfs_tree, _Algorithm.dial_tree, _Algorithm.best_tree]:
+            tree: ShortestPathTree = tree_algorithm(g, s, targets=targets)
+            assert tree.settled < len(g.vertices)
+            if tree_algorithm is not _Algorithm.bfs_tree:
+                assert [tree.distance(t) for t in targets] == [full.distance(t) for t in targets]
+            assert all(t in tree for t in targets)
+
+    def test_shortest_path_tree(self):
+        g = create_test_graph()
+        s = g.vertices[0]
+
+        for algorithm in [AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BELLMAN_FORD, AlgorithmEnum.BEST]:
+            tree: ShortestPathTree = g.shortest_path_tree(s, algorithm)
+            assert tree.start is s
+            for t in g.vertices:
+                path: Path = tree.path_to(t)
+                expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                assert path.edges == expected.edges
+                assert path.value == tree.distance(t) == expected.value
+                assert t in tree
+
+        v = Vertex("u")
+        g += v
+        tree: ShortestPathTree = g.shortest_path_tree(s)
+        assert v not in tree
+        assert tree.path_to(v).edges == [] and tree.distance(v) == float("inf")
+
+        with pytest.raises(LibgraphyError):
+            g.shortest_path_tree(s, AlgorithmEnum.A_STAR)
+
     def test_bellman_ford(self):
         vertices = [Vertex(l) for l in "stxyz"]
         s, t, x, y, z = vertices
@@ -37,6 +127,189 @@ class TestAlgorithm(unittest.TestCase):
         assert path.edges == res_edges
         assert path.value == sum(e.value for e in res_edges)
 
+    def test_bellman_ford_random(self):
+        for _ in range(10):
+            g: Graph = GraphFactory.digraph(30, 90, weighted=True)
+            for e in g.edges[::6]:
+                e.value = -e.value / 4
+            s = g.vertices[0]
+
+            # Rounds over every edge of a frozen snapshot as the reference
+            fg: FrozenGraph = g.freeze()
+            try:
+                fg.find_path(s, s, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+            except LibgraphyError:
+                with pytest.raises(LibgraphyError):
+                    g.shortest_path_tree(s, AlgorithmEnum.BELLMAN_FORD)
+                continue
+
+            tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.BELLMAN_FORD)
+            for t in g.vertices:
+                expected: Path = fg.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+                assert tree.distance(t) == pytest.approx(expected.value)
+                path: Path = tree.path_to(t)
+                if path.edges:
+                    assert path.value == pytest.approx(sum(e.value for e in path.edges))
+
+    def test_bellman_ford_negative_cycle(self):
+        g: Graph = GraphFactory.ring(50, directed=True)
+        g.edges[20].value = -100
+
+        for algorithm in [AlgorithmEnum.BELLMAN_FORD, AlgorithmEnum.BELLMAN_FORD_NUMPY]:
+            with pytest.raises(LibgraphyError):
+                g.find_path(g.vertices[0], g.vertices[10], algorithm = algorithm)
+
+    def test_bellman_ford_numpy(self):
+        for _ in range(5):
+            g: Graph = GraphFactory.digraph(30, 90, weighted=True)
+            for e in g.edges[::8]:
+                e.value = -e.value / 8
+            s = g.vertices[0]
+
+            for t in g.vertices:
+                try:
+                    expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD)
+                except LibgraphyError:
+                    with pytest.raises(LibgraphyError):
+                        g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+                    break
+
+                path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+                assert path.value == pytest.approx(expected.value)
+                assert path.graph is g
+                if path.edges:
+                    assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+                    assert path.value == pytest.approx(sum(e.value for e in path.edges))
+
+        # Edges changed after a query are seen by the next one
+        g = GraphFactory.digraph(30, 90, weighted=True)
+        s, t = g.vertices[0], g.vertices[-1]
+        path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+        for e in path.edges:
+            e.value += 10
+        path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+        assert path.value == pytest.approx(g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD).value)
+
+    def test_bfs(self):
+        for g in [GraphFactory.square_grid(12, 9, 150, diagonals=False), GraphFactory.ring(40), GraphFactory.square_grid_maze(10, 10)]:
+            s = g.vertices[0]
+            tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.BFS)
+            for t in g.vertices:
+                path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BFS)
+                expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                assert path.value == expected.value == tree.distance(t)
+                assert len(path.edges) == (path.value if path.value != float("inf") else 0)
+
+    def test_best_bfs(self):
+        g: Graph = create_grid_graph(10, 13)
+        s, t = g.vertices[0], g.vertices[-5]
+
+        with mock.patch.object(_Algorithm, "bfs", wraps=_Algorithm.bfs) as bfs:
+            assert g.find_path(s, t).value == 17
+            bfs.assert_called_once()
+
+            # Grids with a heuristic still go to A*
+            assert g.find_path(s, t, ManhattanDistance()).value == 17
+            bfs.assert_called_once()
+
+        g.edges[0].value = 2
+        with mock.patch.object(_Algorithm, "bfs", wraps=_Algorithm.bfs) as bfs:
+            g.find_path(s, t)
+            bfs.assert_not_called()
+
+    def test_zero_one_bfs(self):
+        g: Graph = GraphFactory.digraph(40, 200)
+        for i, e in enumerate(g.edges):
+            e.value = i % 3 % 2
+        s = g.vertices[0]
+
+        tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.ZERO_ONE_BFS)
+        for t in g.vertices:
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.ZERO_ONE_BFS)
+            expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+            assert path.value == expected.value == tree.distance(t)
+            if path.edges:
+                assert path.value == sum(e.value for e in path.edges)
+
+        g.edges[0].value = 2
+        with pytest.raises(LibgraphyError):
+            g.find_path(s, g.vertices[1], algorithm = AlgorithmEnum.ZERO_ONE_BFS)
+
+    def test_dial(self):
+        g: Graph = GraphFactory.digraph(40, 200)
+        for i, e in enumerate(g.edges):
+            e.value = i * 37 % 100 + 1
+        s = g.vertices[0]
+
+        tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIAL)
+        for t in g.vertices:
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIAL)
+            expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+            assert path.value == expected.value == tree.distance(t)
+            if path.edges:
+                assert path.value == sum(e.value for e in path.edges)
+
+        g.edges[0].value = 0.5
+        with pytest.raises(LibgraphyError):
+            g.find_path(s, g.vertices[1], algorithm = AlgorithmEnum.DIAL)
+
+    def test_best_integer_weights(self):
+        g = create_test_graph()
+        s, x = g.vertices[0], g.vertices[2]
+
+        with mock.patch.object(_Algorithm, "dial", wraps=_Algorithm.dial) as dial:
+            assert g.find_path(s, x).value == 9
+            dial.assert_called_once()
+
+        for e in g.edges:
+            e.value = e.value % 2
+        with mock.patch.object(_Algorithm, "zero_one_bfs", wraps=_Algorithm.zero_one_bfs) as zero_one_bfs:
+            assert g.find_path(s, x).value == g.find_path(s, x, algorithm = AlgorithmEnum.DIJKSTRA).value
+            zero_one_bfs.assert_called_once()
+
+        g.edges[0].value = 1000
+        with mock.patch.object(_Algorithm, "dijkstra", wraps=_Algorithm.dijkstra) as dijkstra:
+            g.find_path(s, x)
+            dijkstra.assert_called_once()
+
+        g.edges[0].value = 1.5
+        with mock.patch.object(_Algorithm, "dijkstra", wraps=_Algorithm.dijkstra) as dijkstra:
+            g.find_path(s, x)
+            dijkstra.assert_called_once()
+
+    def test_dag(self):
+        g: Graph = GraphFactory.tournament(40, weighted=True)
+        for e in g.edges[::3]:
+            e.value = -e.value
+        s = g.vertices[-1]
+
+        tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DAG)
+        for t in g.vertices:
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DAG)
+            expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD)
+            assert path.value == pytest.approx(expected.value)
+            assert path.value == tree.distance(t)
+
+        g += Edge(g.vertices[0], g.vertices[-1], 1)
+        with pytest.raises(LibgraphyError):
+            g.shortest_path_tree(s, AlgorithmEnum.DAG)
+
+    def test_best_dag(self):
+        g: Graph = GraphFactory.tree(60, directed=True)
+        for i, e in enumerate(g.edges):
+            e.value = i % 5 - 2
+        s, t = g.vertices[0], g.vertices[-1]
+
+        with mock.patch.object(_Algorithm, "dag", wraps=_Algorithm.dag) as dag, \
+             mock.patch.object(_Algorithm, "bellman_ford", wraps=_Algorithm.bellman_ford) as bellman_ford:
+            assert g.find_path(s, t).value == g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD).value
+            dag.assert_called_once()
+
+            g += Edge(t, s, len(g.edges))
+            g.find_path(s, t)
+            dag.assert_called_once()
+            bellman_ford.assert_called()
+
     def test_a_star_grid(self):
         g: Graph = create_grid_graph(10, 13)
 
@@ -51,6 +324,34 @@ class TestAlgorithm(unittest.TestCase):
         path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
         assert path.value == 17
 
+    def test_a_star_goal_termination(self):
+        g: Graph = create_grid_graph(20, 20)
+
+        for s, t in [(g.vertices[0], g.vertices[-1]), (g.vertices[45], g.vertices[213]), (g.vertices[7], g.vertices[7])]:
+            path: Path = g.find_path(s, t, ManhattanDistance(), AlgorithmEnum.A_STAR)
+            expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+            assert path.value == expected.value
+            assert path.settled <= expected.settled
+
+        s, t = g.vertices[0], g.vertices[21]
+        path: Path = g.find_path(s, t, ManhattanDistance(), AlgorithmEnum.A_STAR)
+        assert path.settled < len(g.vertices) // 4
+
+    def test_a_star_default_heuristic(self):
+        # Direct edges to c are longer than the path through y
+        vertices = [Vertex(l) for l in "awxyc"]
+        a, w, x, y, c = vertices
+
+        g = Graph()
+        for v in vertices:
+            g += v
+        for e in [Edge(a, w, 1), Edge(w, c, 50), Edge(a, x, 1), Edge(x, c, 100), Edge(x, y, 1), Edge(y, c, 1)]:
+            g += e
+
+        for algorithm in [AlgorithmEnum.A_STAR, AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BEST]:
+            assert g.find_path(a, c, algorithm = algorithm).value == 3
+            assert g.freeze().find_path(a, c, algorithm = algorithm).value == 3
+
     def test_a_star_hexagonal(self):
         g: Graph = create_hexagonal_flat_graph(8, 5)
 
@@ -79,6 +380,99 @@ class TestAlgorithm(unittest.TestCase):
         path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
         assert path.value == 21
 
+    def test_jps(self):
+        for g, h in [(create_octogonal_graph(20, 30), ChebyshevDistance()), (create_grid_graph(20, 30), ManhattanDistance())]:
+            s, t = g.vertices[0], g.vertices[-3]
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.JPS)
+            expected: Path = g.find_path(s, t, h, AlgorithmEnum.A_STAR)
+            assert path.value == expected.value
+            assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+            assert all(a.successor is b.predecessor for a, b in zip(path.edges, path.edges[1:]))
+            assert path.settled < expected.settled
+
+            path: Path = g.find_path(s, s, algorithm = AlgorithmEnum.JPS)
+            assert path.edges == [] and path.value == 0
+
+    def test_jps_obstacles(self):
+        for g in [create_octogonal_graph(15, 12), create_grid_graph(15, 12), GraphFactory.square_grid_maze(12, 15)]:
+            # Blocked cells, either walled off or only left by their own edges
+            for v in g.vertices[5::7]:
+                while v.neighbors:
+                    del v[0]
+            for v in g.vertices[3::11]:
+                for u in g.vertices:
+                    if v in u.neighbors:
+                        del u[u.neighbors.index(v)]
+
+            for s in g.vertices[::6]:
+                for t in g.vertices[1::5]:
+                    path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.JPS)
+                    expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                    assert path.value == expected.value
+                    assert sum(e.value for e in path.edges) == (path.value if path.edges or s is t else 0)
+
+    def test_jps_octile(self):
+        g: Graph = create_octogonal_graph(12, 12)
+        for e in g.edges:
+            if e.predecessor.x != e.successor.x and e.predecessor.y != e.successor.y:
+                e.value = 1.5
+        for v in g.vertices[13::9]:
+            while v.neighbors:
+                del v[0]
+
+        s = g.vertices[0]
+        for t in g.vertices:
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.JPS)
+            assert path.value == g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA).value
+
+        g.edges[0].value = 2
+        with pytest.raises(LibgraphyError):
+            g.find_path(s, t, algorithm = AlgorithmEnum.JPS)
+
+        g: Graph = create_grid_graph(3, 3)
+        g += Edge(g.vertices[0], g.vertices[8], 1)
+        with pytest.raises(LibgraphyError):
+            g.find_path(g.vertices[0], g.vertices[8], algorithm = AlgorithmEnum.JPS)
+
+        with pytest.raises(LibgraphyError):
+            create_test_graph().find_path(s, t, algorithm = AlgorithmEnum.JPS)
+
+    def test_jps_grid(self):
+        # Grids must tell which cells and moves exist
+        class NoMoves(_JumpPointGrid):
+            def _on_grid(self, x: int, y: int) -> bool:
+                return True
+
+        with pytest.raises(TypeError):
+            _JumpPointGrid(False, 1, 2)
+        with pytest.raises(TypeError):
+            NoMoves(False, 1, 2)
+
+    def test_delta_stepping(self):
+        g: Graph = GraphFactory.digraph(40, 160, weighted=True)
+        s = g.vertices[0]
+        expected: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+        tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DELTA_STEPPING)
+        for t in g.vertices:
+            assert tree.distance(t) == pytest.approx(expected.distance(t))
+            path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DELTA_STEPPING)
+            assert path.value == pytest.approx(expected.distance(t))
+            assert tree.path_to(t).value == pytest.approx(expected.distance(t))
+
+        targets = g.vertices[1:4]
+        distances = g.distance_matrix([s], targets, AlgorithmEnum.DELTA_STEPPING)
+        assert [* distances[0]] == pytest.approx([expected.distance(t) for t in targets])
+
+        # The snapshot is reused until the graph changes
+        fg: FrozenGraph = g._frozen()
+        assert g._frozen() is fg
+        for e in g.edges[::3]:
+            e.value += 5
+        assert g._frozen() is not fg
+        expected = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+        tree = g.shortest_path_tree(s, AlgorithmEnum.DELTA_STEPPING)
+        assert all(tree.distance(t) == pytest.approx(expected.distance(t)) for t in g.vertices)
+
     def test_best_negative(self):
         # TODO: Move this to utils
         vertices = [Vertex(l) for l in "stxyz"]
@@ -0,0 +1,74 @@
+import unittest
+import pytest
+from unittest import mock
+
+from libgraphy import *
+from libgraphy.allpairs import _AllPairs
+from .utils import create_test_graph
+
+class TestAllPairs(unittest.TestCase):
+    def assert_all_pairs(self, g: Graph, apsp: AllPairsShortestPaths):
+        assert apsp.distances.shape == apsp.successors.shape == (len(g.vertices), len(g.vertices))
+        for s in g.vertices:
+            tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.BELLMAN_FORD)
+            for t in g.vertices:
+                assert apsp.distance(s, t) == pytest.approx(tree.distance(t))
+
+                path: Path = apsp.path(s, t)
+                if s is not t and t in tree:
+                    assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+                    assert sum(e.value for e in path.edges) == pytest.approx(path.value)
+                else:
+                    assert path.edges == []
+
+    def test_johnson(self):
+        g: Graph = GraphFactory.digraph(30, 90, weighted=True)
+        for e in g.edges[::7]:
+            e.value = -e.value / 10
+
+        try:
+            apsp: AllPairsShortestPaths = g.all_pairs_shortest_paths(AlgorithmEnum.JOHNSON)
+        except LibgraphyError: # negative cycle
+            with pytest.raises(LibgraphyError):
+                for s in g.vertices:
+                    g.shortest_path_tree(s, AlgorithmEnum.BELLMAN_FORD)
+            return
+        self.assert_all_pairs(g, apsp)
+
+    def test_floyd_warshall(self):
+        g: Graph = GraphFactory.digraph(30, 90, weighted=True)
+        self.assert_all_pairs(g, g.all_pairs_shortest_paths(AlgorithmEnum.FLOYD_WARSHALL))
+
+        g: Graph = create_test_graph()
+        apsp: AllPairsShortestPaths = g.all_pairs_shortest_paths(AlgorithmEnum.FLOYD_WARSHALL)
+        assert (apsp.distances == g.all_pairs_shortest_paths(AlgorithmEnum.JOHNSON).distances).all()
+        self.assert_all_pairs(g, apsp)
+
+    def test_negative_cycle(self):
+        g: Graph = create_test_graph()
+        g.edges[0].value = -20
+
+        for algorithm in [AlgorithmEnum.JOHNSON, AlgorithmEnum.FLOYD_WARSHALL]:
+            with pytest.raises(LibgraphyError):
+                g.all_pairs_shortest_paths(algorithm)
+
+    def test_best(self):
+        with mock.patch.object(_AllPairs, "floyd_warshall", wraps=_AllPairs.floyd_warshall) as floyd_warshall, \
+             mock.patch.object(_AllPairs, "johnson", wraps=_AllPairs.johnson) as johnson:
+            GraphFactory.tournament(20, weighted=True).all_pairs_shortest_paths()
+            floyd_warshall.assert_called_once()
+            johnson.assert_not_called()
+
+            GraphFactory.ring(200, directed=True).all_pairs_shortest_paths()
+            johnson.assert_called_once()
+
+    def test_unsupported(self):
+        g: Graph = create_test_graph()
+
+        with pytest.raises(LibgraphyError):
+            g.all_pairs_shortest_paths(AlgorithmEnum.A_STAR)
+        with pytest.raises(LibgraphyError):
+            g.find_path(g.vertices[0], g.vertices[1], algorithm = AlgorithmEnum.JOHNSON)
+        with mock.patch("libgraphy.allpairs.numpy_found", False):
+            with pytest.raises(ImportError):
+                g.all_pairs_shortest_paths()
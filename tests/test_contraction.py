@@ -0,0 +1,87 @@
+import unittest
+import pytest
+import tempfile
+
+from libgraphy import *
+from .utils import create_test_graph, create_grid_graph
+
+class TestContractionHierarchy(unittest.TestCase):
+    def assert_paths(self, g: Graph, ch: ContractionHierarchy, step: int = 3):
+        for s in g.vertices[::step]:
+            tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+            for t in g.vertices:
+                path: Path = ch.find_path(s, t)
+                assert path.value == pytest.approx(tree.distance(t))
+                if s is not t and t in tree:
+                    # Shortcuts are unpacked to the original edges
+                    assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+                    assert all(e in g.edges for e in path.edges)
+                    assert all(a.successor is b.predecessor for a, b in zip(path.edges, path.edges[1:]))
+                    assert sum(e.value for e in path.edges) == pytest.approx(path.value)
+                else:
+                    assert path.edges == []
+
+    def test_find_path(self):
+        g = create_test_graph()
+        ch: ContractionHierarchy = ContractionHierarchy(g)
+        assert len(ch) == len(g.vertices)
+        self.assert_paths(g, ch)
+
+        g: Graph = GraphFactory.digraph(60, 240, weighted=True)
+        self.assert_paths(g, ContractionHierarchy(g))
+
+    def test_grid(self):
+        g: Graph = create_grid_graph(15, 15)
+        for i, e in enumerate(g.edges):
+            e.value = i * 7 % 10 + 1
+        ch: ContractionHierarchy = g.preprocess_ch()
+        self.assert_paths(g, ch, 16)
+
+        # The upward searches only see a fraction of the graph
+        s, t = g.vertices[0], g.vertices[-1]
+        assert ch.find_path(s, t).settled < len(g.vertices) // 2
+
+    def test_grid_shortcuts(self):
+        for size in (15, 30):
+            g: Graph = create_grid_graph(size, size)
+            ch: ContractionHierarchy = g.preprocess_ch()
+            assert ch.shortcuts() < len(g.edges)
+            self.assert_paths(g, ch, 150)
+
+    def test_algorithm(self):
+        g: Graph = GraphFactory.digraph(40, 160, weighted=True)
+        s, t = g.vertices[0], g.vertices[-1]
+
+        ch: ContractionHierarchy = g.preprocess_ch()
+        assert g.preprocess_ch() is ch
+        path: Path = g.find_path(s, t, algorithm = AlgorithmEnum.CH)
+        assert path.value == pytest.approx(g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA).value)
+
+        # Changes to the graph need a new hierarchy
+        g.edges[0].value = 0.5
+        assert g.preprocess_ch() is not ch
+
+    def test_negative(self):
+        g = create_test_graph()
+        g.edges[0].value = -1
+
+        with pytest.raises(LibgraphyError):
+            g.preprocess_ch()
+
+    def test_json(self):
+        g: Graph = GraphFactory.digraph(40, 160, weighted=True)
+        ch: ContractionHierarchy = g.preprocess_ch()
+
+        with tempfile.NamedTemporaryFile(suffix=".json") as f:
+            ContractionHierarchy.write_to_json_file(ch, f.name)
+            loaded: ContractionHierarchy = ContractionHierarchy.read_from_json_file(f.name, g)
+
+        assert loaded.shortcuts() == ch.shortcuts()
+        assert g.preprocess_ch(loaded) is loaded
+        assert g.preprocess_ch() is loaded
+        self.assert_paths(g, loaded)
+
+        with pytest.raises(LibgraphyError):
+            ContractionHierarchy.from_json(ContractionHierarchy.to_json(ch), create_test_graph())
+        with pytest.raises(LibgraphyError):
+            create_test_graph().preprocess_ch(loaded)
@@ -1,9 +1,11 @@
 import unittest
 import pytest
 
-from libgraphy import Vertex, Edge, Graph
+from libgraphy import Vertex, Edge, Graph, Path, AlgorithmEnum
 from libgraphy.exception import LibgraphyError
 
+from copy import deepcopy
+
 class TestEdge(unittest.TestCase):
     def test___init__str(self):
         e = Edge("v1", "v2")
@@ -164,3 +166,100 @@ class TestEdge(unittest.TestCase):
         with pytest.raises(LibgraphyError):
             g1 = g1 + edge2
 
+    def test_edge_list_index(self):
+        v1, v2, v3 = Vertex(1), Vertex(2), Vertex(3)
+        e1 = Edge(v1, v2)
+        e2 = Edge(v2, v3)
+
+        g = Graph()
+        g += e1
+        g += e2
+
+        assert g.edges[(v1, v2)] is e1 and g.edges[e2] is e2
+        assert g.edges[(v2, v1)] is None
+        assert (v1, v2) in g.edges and e1 in g.edges
+        assert (v1, v3) not in g.edges
+        assert g.edges[0] is e1 and g.edges[-1] is e2
+
+        g.edges.remove(e1)
+        assert g.edges[(v1, v2)] is None and e1 not in g.edges
+
+        del g.edges[-1]
+        assert g.edges[(v2, v3)] is None and g.edges == []
+
+        g.edges.append(e1)
+        e1.reverse()
+        assert g.edges[(v1, v2)] is None and g.edges[(v2, v1)] is e1
+
+    def test_edge_list_incoming(self):
+        v1, v2, v3 = Vertex(1), Vertex(2), Vertex(3)
+        e1 = Edge(v1, v3)
+        e2 = Edge(v2, v3)
+
+        g = Graph()
+        g += e1
+        g += e2
+
+        assert g.edges._incoming(v3) == [e1, e2]
+        assert g.edges._incoming(v1) == []
+
+        g.edges.remove(e1)
+        assert g.edges._incoming(v3) == [e2]
+
+        e2.reverse()
+        assert g.edges._incoming(v3) == [] and g.edges._incoming(v2) == [e2]
+
+        g.edges.clear()
+        assert g.edges._incoming(v2) == []
+
+    def test_edge_list_endpoints(self):
+        v1, v2, v3, v4 = Vertex(1), Vertex(2), Vertex(3), Vertex(4)
+        e1 = Edge(v1, v2)
+        e2 = Edge(v2, v3)
+
+        g = Graph()
+        g += e1
+        g += e2
+        g += v4
+        assert g.edges[(v1, v2)] is e1 and g.edges._incoming(v2) == [e1]
+
+        e1.successor = v3
+        assert g.edges[(v1, v2)] is None and g.edges[(v1, v3)] is e1
+        assert g.edges._incoming(v2) == [] and g.edges._incoming(v3) == [e2, e1]
+
+        e2.predecessor = v4
+        assert g.edges[(v2, v3)] is None and g.edges[(v4, v3)] is e2 and e2 in g.edges
+        assert g.edges._incoming(v3) == [e1, e2]
+
+    def test_edge_list_index_copy(self):
+        g = Graph()
+        for i in range(5):
+            g += Edge(str(i), str(i + 1))
+
+        for ng in [deepcopy(g), Graph.from_json(Graph.to_json(g))]:
+            assert len(ng.edges) == len(g.edges)
+            for e in ng.edges:
+                assert ng.edges[(e.predecessor, e.successor)] is e
+                assert (e.predecessor, e.successor) not in g.edges
+
+        g *= 2
+        for e in g.edges:
+            assert g.edges[(e.predecessor, e.successor)] is e and e.value == 2
+
+        # Searches follow the adjacency, which must see the scaled values
+        a, b, c = Vertex("a"), Vertex("b"), Vertex("c")
+        g = Graph()
+        for v in [a, b, c]:
+            g += v
+        g += Edge(a, b, 1)
+        g += Edge(b, c, 1)
+
+        g *= 2
+        for algorithm in [AlgorithmEnum.BELLMAN_FORD, AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BEST]:
+            path: Path = g.find_path(a, c, algorithm = algorithm)
+            assert path.value == 4 and all(e in g.edges for e in path.edges)
+
+        ng: Graph = g * 3
+        assert [e.value for e in g.edges] == [2, 2]
+        assert ng.find_path(ng.vertices[0], ng.vertices[-1]).value == 12
+
@@ -0,0 +1,215 @@
+import unittest
+import pytest
+from unittest import mock
+
+from libgraphy import *
+from libgraphy import frozengraph
+from .utils import create_test_graph, create_octogonal_graph
+
+class TestFrozenGraph(unittest.TestCase):
+    def test_csr(self):
+        g = create_test_graph()
+        fg: FrozenGraph = g.freeze()
+
+        assert len(fg) == len(g.vertices)
+        assert list(fg.offsets) == [0, 2, 4, 5, 8, 10]
+        assert len(fg.targets) == len(fg.weights) == len(fg.edges) == len(g.edges)
+
+        for i, v in enumerate(fg.vertices):
+            assert fg.index(v) == i
+            for k in range(fg.offsets[i], fg.offsets[i+1]):
+                e = fg.edges[k]
+                assert e.predecessor is v
+                assert fg.vertices[fg.targets[k]] is e.successor
+                assert fg.weights[k] == e.value
+
+    def test_snapshot(self):
+        g = create_test_graph()
+        fg: FrozenGraph = g.freeze()
+
+        g += Edge(g.vertices[0], g.vertices[2], 1)
+        assert len(fg.edges) == len(g.edges) - 1
+
+        with pytest.raises(LibgraphyError):
+            fg.find_path(g.vertices[0], Vertex("u"))
+
+    def test_non_numeric(self):
+        g = Graph()
+        g += Edge("a", "b", "aa")
+
+        with pytest.raises(LibgraphyError):
+            g.freeze()
+
+    def test_dijkstra(self):
+        g = create_test_graph()
+        fg: FrozenGraph = g.freeze()
+
+        for s in g.vertices:
+            for t in g.vertices:
+                path: Path = fg.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                assert path.edges == expected.edges
+                assert path.value == expected.value
+                assert path.graph is g
+                # Integer edge values give integer distances
+                assert type(path.value) is int or path.value == float("inf")
+
+    def test_bellman_ford(self):
+        g: Graph = GraphFactory.digraph(30, 120, weighted=True)
+        for e in g.edges[::7]:
+            e.value = -e.value / 10
+        fg: FrozenGraph = g.freeze()
+
+        s = g.vertices[0]
+        for t in g.vertices:
+            try:
+                expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD)
+            except LibgraphyError:
+                with pytest.raises(LibgraphyError):
+                    fg.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD)
+                return
+            path: Path = fg.find_path(s, t, algorithm = AlgorithmEnum.BELLMAN_FORD)
+            assert path.value == pytest.approx(expected.value)
+
+    def test_a_star(self):
+        g: Graph = create_octogonal_graph(16, 24)
+        fg: FrozenGraph = g.freeze()
+
+        s, t = [g.vertices[0], g.vertices[-3]]
+
+        path: Path = fg.find_path(s, t, ChebyshevDistance(), AlgorithmEnum.A_STAR)
+        assert path.value == 21
+        assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+
+        path: Path = fg.find_path(s, t, heuristic=ChebyshevDistance())
+        assert fg.best_algorithm(ChebyshevDistance()) == AlgorithmEnum.A_STAR
+        assert fg.best_algorithm() == AlgorithmEnum.BFS
+        assert path.value == 21
+
+    def test_best(self):
+        g = create_test_graph()
+        fg: FrozenGraph = g.freeze()
+        assert fg.best_algorithm() == AlgorithmEnum.DIAL
+
+        g.edges[0].value = -1
+        assert fg.best_algorithm() == AlgorithmEnum.DIAL
+        assert g.freeze().best_algorithm() == AlgorithmEnum.BELLMAN_FORD
+
+        g.edges[0].value = 0.5
+        assert g.freeze().best_algorithm() == AlgorithmEnum.DIJKSTRA
+
+        for e in g.edges:
+            e.value = int(e.value) % 2
+        assert g.freeze().best_algorithm() == AlgorithmEnum.ZERO_ONE_BFS
+
+        g = GraphFactory.square_grid(5, 5, 40, diagonals=False)
+        assert g.freeze().best_algorithm() == AlgorithmEnum.BFS
+        for e in g.edges:
+            e.value = 2
+        assert g.freeze().best_algorithm() == AlgorithmEnum.DIAL
+
+    def test_every_algorithm(self):
+        # Same paths as on the graph for every path algorithm of Graph.find_path
+        g: Graph = create_octogonal_graph(6, 6)
+        for e in g.edges:
+            e.value = 1 if e.predecessor.x == e.successor.x or e.predecessor.y == e.successor.y else 2
+        dag: Graph = GraphFactory.digraph(20, 50, weighted=True)
+        for e in [* dag.edges]:
+            if dag.vertices.index(e.predecessor) >= dag.vertices.index(e.successor):
+                del e.predecessor[e.predecessor.neighbors.index(e.successor)]
+
+        for graph, algorithms in [(g, [AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA, AlgorithmEnum.BFS,
+                                       AlgorithmEnum.DIAL, AlgorithmEnum.CH, AlgorithmEnum.JPS, AlgorithmEnum.BEST]),
+                                  (dag, [AlgorithmEnum.DAG, AlgorithmEnum.BELLMAN_FORD, AlgorithmEnum.BIDIRECTIONAL_DIJKSTRA, AlgorithmEnum.BEST])]:
+            fg: FrozenGraph = graph.freeze()
+            for s in graph.vertices[::7]:
+                for t in graph.vertices:
+                    for algorithm in algorithms:
+                        path: Path = fg.find_path(s, t, algorithm = algorithm)
+                        expected: Path = graph.find_path(s, t, algorithm = algorithm)
+                        assert path.value == pytest.approx(expected.value)
+                        if path.edges:
+                            assert path.edges[0].predecessor is s and path.edges[-1].successor is t
+                            assert path.value == pytest.approx(sum(e.value for e in path.edges))
+                            # Same type as the edge values, integers on the octogonal graph
+                            assert type(path.value) is type(sum(e.value for e in path.edges))
+
+        for e in g.edges:
+            e.value -= 1
+        fg = g.freeze()
+        s = g.vertices[0]
+        for t in g.vertices:
+            assert fg.find_path(s, t, algorithm = AlgorithmEnum.ZERO_ONE_BFS).value == g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA).value
+
+        with pytest.raises(LibgraphyError):
+            fg.find_path(s, t, algorithm = AlgorithmEnum.DAG)
+        with pytest.raises(LibgraphyError):
+            create_test_graph().freeze().find_path(s, t, algorithm = AlgorithmEnum.JOHNSON)
+
+    def test_pure_python(self):
+        g: Graph = GraphFactory.digraph(30, 120, weighted=True)
+        fg: FrozenGraph = g.freeze()
+
+        s = g.vertices[0]
+        for algorithm in [AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BELLMAN_FORD]:
+            for t in g.vertices:
+                with mock.patch("libgraphy.frozengraph.scipy_found", False):
+                    path: Path = fg.find_path(s, t, algorithm = algorithm)
+                expected: Path = fg.find_path(s, t, algorithm = algorithm)
+                assert path.value == pytest.approx(expected.value)
+                assert path.edges == expected.edges
+
+    def test_bellman_ford_numpy(self):
+        g = create_test_graph()
+        fg: FrozenGraph = g.freeze()
+
+        for t in g.vertices:
+            path: Path = fg.find_path(g.vertices[0], t, algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+            expected: Path = fg.find_path(g.vertices[0], t, algorithm = AlgorithmEnum.DIJKSTRA)
+            assert path.value == expected.value and type(path.value) is type(expected.value)
+            assert path.edges == expected.edges
+
+        with mock.patch("libgraphy.frozengraph.numpy_found", False):
+            with pytest.raises(ImportError):
+                fg.find_path(g.vertices[0], g.vertices[1], algorithm = AlgorithmEnum.BELLMAN_FORD_NUMPY)
+
+    def test_delta_stepping(self):
+        g: Graph = GraphFactory.digraph(30, 120, weighted=True)
+        for e in g.edges[::5]:
+            e.value = 0
+        fg: FrozenGraph = g.freeze()
+        assert fg.delta() > 0
+
+        s = g.vertices[0]
+        tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+        for delta in [None, 0.05, 1, 1000]:
+            distances, previous = fg.delta_stepping(s, delta, return_predecessors = True)
+            for i, v in enumerate(fg.vertices):
+                assert distances[i] == pytest.approx(tree.distance(v))
+                if previous[i] >= 0:
+                    u: Vertex = fg.vertices[previous[i]]
+                    assert any(e.successor is v and distances[previous[i]] + e.value == pytest.approx(distances[i]) for e in u.adjacent_edges)
+
+        for t in g.vertices:
+            path: Path = fg.find_path(s, t, algorithm = AlgorithmEnum.DELTA_STEPPING)
+            assert path.value == pytest.approx(tree.distance(t))
+            if path.edges:
+                assert path.edges[-1].successor is t
+                assert path.value == pytest.approx(sum(e.value for e in path.edges))
+
+        with pytest.raises(LibgraphyError):
+            fg.delta_stepping(s, 0)
+
+        g.edges[0].value = -1
+        with pytest.raises(LibgraphyError):
+            g.freeze().delta_stepping(s)
+
+        # As if importing NumPy had failed: np is never bound
+        with mock.patch.object(frozengraph, "numpy_found", False), mock.patch.dict(frozengraph.__dict__):
+            del frozengraph.__dict__["np"]
+            with pytest.raises(ImportError):
+                fg.find_path(s, g.vertices[1], algorithm = AlgorithmEnum.DELTA_STEPPING)
+            with pytest.raises(ImportError):
+                g.find_path(s, g.vertices[1], algorithm = AlgorithmEnum.DELTA_STEPPING)
+            with pytest.raises(ImportError):
+                fg.delta_stepping(s)
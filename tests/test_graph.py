@@ -3,6 +3,7 @@ import unittest
 import pytest
 
 import tempfile
+from unittest import mock
 
 try:
     import networkx as nx
@@ -16,7 +17,7 @@ try:
 except ImportError:
     scipy_found = False
 
-from libgraphy import Vertex, Edge, Graph, LibgraphyError
+from libgraphy import Vertex, Edge, Graph, GraphFactory, AlgorithmEnum, LibgraphyError
 from libgraphy.utils import _DebugGraphviz
 from .utils import assert_compare_graph_values, create_test_graph
 
@@ -25,6 +26,8 @@ import jsonpickle
 
 import filecmp
 
+from copy import deepcopy
+
 class TestGraph(unittest.TestCase):
     # def setUp(self):
     #     self.monkeypatch = MonkeyPatch()
@@ -112,15 +115,17 @@ class TestGraph(unittest.TestCase):
 
     def test__imul__(self):
         g = self.repr_init_graph()
-        edges = g.edges
+        edges = list(g.edges)
+        values = [e.value for e in g.edges]
 
         g *= 4
 
+        # Same edges, scaled in place
         for i in range(len(g.edges)):
-            e = edges[i]
             ge = g.edges[i]
-            assert ge.value == 4 * e.value
-            assert e.graph is ge.graph is g
+            assert ge is edges[i]
+            assert ge.value == 4 * values[i]
+            assert ge.graph is g
 
     def test_graph__iadd__(self):
         g = Graph()
@@ -166,6 +171,180 @@ class TestGraph(unittest.TestCase):
                     and ce.value == fe.value \
                     and fe.graph is f
 
+    def test_vertex_index(self):
+        v0, v1, v2 = Vertex(0), Vertex(1), Vertex(2)
+
+        g = Graph()
+        g += v0
+        g += Edge(v1, v2)
+        assert v0 in g.vertices and v1 in g.vertices and v2 in g.vertices
+
+        del g[0]
+        assert v0 not in g.vertices
+
+        g.trim_vertices()
+        assert g.vertices == [v1, v2] and v1 in g.vertices
+
+        h = Graph()
+        v3 = Vertex(3)
+        h += v3
+        g += h
+        assert v3 in g.vertices
+
+        # vertices connected before joining the graph
+        v4, v5 = Vertex(4), Vertex(5)
+        v4 += v5
+        g += v4
+        f = deepcopy(g)
+
+        g += v5
+        assert g.edges[(v4, v5)] is not None
+
+        f += f.vertices[-1].neighbors[0]
+        assert f.edges[(f.vertices[-2], f.vertices[-1])] is not None
+        assert len(f.edges) == len(g.edges)
+
+        # removals keep the index and the pending links in sync
+        v6, v7 = Vertex(6), Vertex(7)
+        v6 += v7
+        g += v6
+        g.vertices.remove(v6)
+        assert v6 not in g.vertices
+        g += v7
+        assert v7 in g.vertices and g.edges[(v6, v7)] is None
+
+        v1.graph = None
+        g.vertices[0] = v6
+        assert v6 in g.vertices and v1 not in g.vertices
+        g.vertices.insert(1, v1)
+        assert v1 in g.vertices
+        del g.vertices[:2]
+        assert v6 not in g.vertices and v1 not in g.vertices and v2 in g.vertices
+
+        # a removed vertex finds the members linking to it when it joins again
+        g.vertices.remove(v5)
+        v5.graph = None
+        assert v5 not in g.vertices
+        g.edges.remove(g.edges[(v4, v5)])
+        g += v5
+        assert v5 in g.vertices and g.edges[(v4, v5)] is not None
+
+    def test_strongly_connected_components(self):
+        g: Graph = GraphFactory.digraph(60, 90)
+        components = g.strongly_connected_components()
+
+        assert sorted(v.name for c in components for v in c) == sorted(v.name for v in g.vertices)
+        if nx_found:
+            expected = {frozenset(c) for c in nx.strongly_connected_components(Graph.to_networkx(g))}
+            assert {frozenset(v.name for v in c) for c in components} == expected
+
+        # Long paths don't hit the recursion limit
+        ring: Graph = GraphFactory.ring(5000, directed=True)
+        assert len(ring.strongly_connected_components()) == 1
+
+    def test_connected_components(self):
+        g: Graph = GraphFactory.digraph(80, 60)
+        components = g.connected_components()
+
+        assert sorted(v.name for c in components for v in c) == sorted(v.name for v in g.vertices)
+        assert [c[0] for c in components] == sorted((c[0] for c in components), key=g.vertices.index)
+        if nx_found:
+            expected = {frozenset(c) for c in nx.weakly_connected_components(Graph.to_networkx(g))}
+            assert {frozenset(v.name for v in c) for c in components} == expected
+
+        assert g.connected_components(weak=False) == g.strongly_connected_components()
+
+    def test_condensation(self):
+        g: Graph = GraphFactory.digraph(60, 90, weighted=True)
+        components = g.strongly_connected_components()
+        dag: Graph = g.condensation()
+
+        assert len(dag.vertices) == len(components)
+        assert dag.traits().has_cycles is False
+        for i, v in enumerate(dag.vertices):
+            assert v.value == components[i]
+        for e in dag.edges:
+            # Reverse topological order
+            assert e.successor.name < e.predecessor.name
+            assert e.value == min(ge.value for ge in g.edges if ge.predecessor in e.predecessor.value and ge.successor in e.successor.value)
+
+    def test_topological_order(self):
+        for g in [GraphFactory.tournament(30), GraphFactory.tree(50, directed=True), GraphFactory.digraph(60, 90).condensation()]:
+            order = list(g.topological_order())
+            position = {v: i for i, v in enumerate(order)}
+
+            assert len(order) == len(g.vertices)
+            for e in g.edges:
+                assert position[e.predecessor] < position[e.successor]
+
+        # Vertices before the cycle are still yielded
+        v0, v1, v2 = Vertex(0), Vertex(1), Vertex(2)
+        g = Graph()
+        g += Edge(v0, v1, 1)
+        g += Edge(v1, v2, 1)
+        g += Edge(v2, v1, 1)
+        order = g.topological_order()
+        assert next(order) is v0
+        with pytest.raises(LibgraphyError):
+            next(order)
+
+    def test_distance_matrix(self):
+        g: Graph = GraphFactory.digraph(30, 120, weighted=True)
+        sources, targets = g.vertices[:5], g.vertices[::3]
+
+        distances, predecessors = g.distance_matrix(sources, targets, return_predecessors=True)
+        assert distances.shape == (len(sources), len(targets))
+        assert predecessors.shape == (len(sources), len(g.vertices))
+
+        for i, s in enumerate(sources):
+            for j, t in enumerate(targets):
+                expected = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+                assert distances[i, j] == pytest.approx(expected.value)
+
+                # Walk the predecessors back to the source
+                path = []
+                k = g.vertices.index(t)
+                while predecessors[i, k] >= 0:
+                    path.append(g.vertices[k])
+                    k = predecessors[i, k]
+                if expected.edges:
+                    assert g.vertices[k] is s
+                    assert path[::-1] == [e.successor for e in expected.edges]
+
+        assert (g.distance_matrix(sources, targets, AlgorithmEnum.BELLMAN_FORD) == distances).all()
+
+        # Worker processes give the same matrices
+        for algorithm in [AlgorithmEnum.BEST, AlgorithmEnum.DIJKSTRA]:
+            for t in [targets, None]:
+                expected_distances, expected_predecessors = g.distance_matrix(g.vertices, t, algorithm, return_predecessors=True, workers=1)
+                parallel_distances, parallel_predecessors = g.distance_matrix(g.vertices, t, algorithm, return_predecessors=True, workers=2)
+                assert (parallel_distances == expected_distances).all()
+                assert (parallel_predecessors == expected_predecessors).all()
+        assert (g.distance_matrix(sources, targets, workers=2) == distances).all()
+        assert g.distance_matrix().shape == (len(g.vertices), len(g.vertices))
+
+        with pytest.raises(LibgraphyError):
+            g.distance_matrix(sources, targets, AlgorithmEnum.A_STAR)
+        with pytest.raises(LibgraphyError):
+            g.distance_matrix([Vertex("u")])
+        with pytest.raises(LibgraphyError):
+            g.distance_matrix(workers=0)
+        with mock.patch("libgraphy.graph.numpy_found", False):
+            with pytest.raises(ImportError):
+                g.distance_matrix()
+
+    def test_find_path_unreachable_component(self):
+        v0, v1, v2 = Vertex(0), Vertex(1), Vertex(2)
+        g = Graph()
+        g += Edge(v0, v1, 1)
+        g += Edge(v1, v2, 1)
+        g.strongly_connected_components()
+
+        for algorithm in [AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BELLMAN_FORD, AlgorithmEnum.BEST]:
+            path = g.find_path(v2, v0, algorithm = algorithm)
+            assert path.edges == [] and path.value == float("inf")
+            assert g.find_path(v0, v2, algorithm = algorithm).value == 2
+
     def test__mul__(self):
         g = self.repr_init_graph()
         h = 4 * g
@@ -1,5 +1,7 @@
 import unittest
 import pytest
+from unittest import mock
+from collections import Counter
 from libgraphy import *
 from .utils import grid_level4_graph, grid_level6_graph, grid_level8_graph
 
@@ -147,6 +149,32 @@ class TestGraphTraits(unittest.TestCase):
         gt.check_if_has_cycles()
         assert gt.has_cycles is False
 
+    def test_check_if_connected_weak(self):
+        v0, v1, v2 = Vertex(0), Vertex(1), Vertex(2)
+        g: Graph = Graph()
+        g += v0
+        g += Edge(v1, v0)
+        g += Edge(v1, v2)
+
+        gt: Graph.Traits = Graph.Traits(g)
+        gt.check_if_connected()
+        assert gt.is_connected is True
+
+        g += Vertex(3)
+        assert g.traits().is_connected is False
+
+    def test_check_if_has_cycles_deep(self):
+        g: Graph = GraphFactory.ring(5000, directed=True)
+        gt: Graph.Traits = Graph.Traits(g)
+        gt.check_if_has_cycles()
+        assert gt.has_cycles is True
+
+        del g.vertices[-1][0]
+        assert g.traits().has_cycles is False
+
+        g += Edge(g.vertices[10], g.vertices[10])
+        assert g.traits().has_cycles is True
+
     def test_check_if_has_cycles_true(self):
         g: Graph = Graph()
         gt: Graph.Traits = Graph.Traits(g)
@@ -251,3 +279,96 @@ class TestGraphTraits(unittest.TestCase):
         assert gt.is_full is False
         assert gt.is_empty is False
 
+
+    def test_traits_cache(self):
+        g: Graph = grid_level4_graph()
+        gt: Graph.Traits = g.traits()
+
+        assert g.traits() is gt
+        assert gt.is_grid is True and gt.has_negative_edges is False
+
+        g.edges[0].value = -1
+        assert g.traits() is not gt
+        assert g.traits().has_negative_edges is True and g.traits().is_grid is False
+
+        gt = g.traits()
+        g.edges[0].value = 1
+        assert g.traits().has_negative_edges is False
+
+        gt = g.traits()
+        g += Vertex("u")
+        assert g.traits() is not gt and g.traits().is_connected is False
+
+        gt = g.traits()
+        g.edges.pop()
+        assert g.traits() is not gt
+
+        gt = g.traits()
+        g.edges.start_at(g.vertices[0])
+        assert g.traits() is gt
+
+    def test_lazy_traits(self):
+        g: Graph = grid_level4_graph()
+        g.edges[0].value = 2
+
+        with mock.patch.object(Graph.Traits, "check_if_directional") as directional, \
+             mock.patch.object(Graph.Traits, "check_if_has_cycles", autospec=True, side_effect=Graph.Traits.check_if_has_cycles) as cycles, \
+             mock.patch.object(Graph.Traits, "check_if_connected") as connected:
+            g.find_path(g.vertices[0], g.vertices[-1])
+            g.find_path(g.vertices[0], g.vertices[-1])
+
+            # Weighted graphs are not grids, whatever their direction
+            directional.assert_not_called()
+            # BEST looks for a DAG once per graph version
+            cycles.assert_called_once()
+            connected.assert_not_called()
+
+        gt: Graph.Traits = g.traits()
+        assert gt.is_weighted is True and gt.is_grid is False and gt.grid_level is None
+        assert gt.has_cycles is True and gt.is_connected is True
+        assert gt.is_directional is True
+
+        # Eager traits still report unchecked properties as None
+        gt = Graph.Traits(g)
+        assert gt.is_weighted is None and gt.has_cycles is None
+
+    def test_incremental_traits(self):
+        g: Graph = grid_level4_graph()
+        g.traits().grid_level
+
+        def check():
+            gt: Graph.Traits = g.traits()
+            expected: Graph.Traits = Graph.Traits.traits(g)
+            for trait in ["is_weighted", "has_negative_edges", "is_grid", "grid_level", "is_full", "is_empty", "has_integer_weights", "max_weight"]:
+                assert getattr(gt, trait) == getattr(expected, trait), trait
+            out_degree = Counter(e.predecessor for e in g.edges)
+            assert g._trait_counters().max_out_degree() == max(out_degree.values(), default=0)
+
+        check()
+        g.edges[3].value = -2
+        check()
+        g.edges[3].value = 7
+        check()
+        g.edges[3].value = 0.5
+        check()
+        g.edges[(g.edges[3].predecessor, g.edges[3].successor)] = 1
+        check()
+        del g.vertices[0][-1]
+        check()
+        g += Edge(g.vertices[0], Vertex("u"), 5)
+        check()
+        g.edges[-1].reverse()
+        check()
+        g.edges.remove(g.edges[0])
+        check()
+        g.edges = [e for e in g.edges if e.value == 1]
+        check()
+
+        # Counters are updated in place, not rebuilt
+        counters = g._trait_counters()
+        for e in g.edges:
+            e.value = 2
+            assert g.traits().is_weighted is True
+        g.edges.pop()
+        assert g._trait_counters() is counters
+        check()
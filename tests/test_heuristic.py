@@ -1,7 +1,9 @@
 import unittest
 import pytest
+from unittest import mock
 
 from libgraphy import *
+from libgraphy.heuristic import _HeuristicCache
 from .utils import create_test_graph, create_grid_graph, create_hexagonal_flat_graph, create_octogonal_graph
 
 
@@ -14,13 +16,21 @@ class TestHeuristic(unittest.TestCase):
         h = Heuristic()
 
         for v in g.vertices:
-            expected_val = 0
-            for e in v.adjacent_edges:
-                if e.successor == end:
-                    expected_val = e.value
+            assert h.evaluate(v, end, g) == 0
 
-            value = h.evaluate(v, end, g)
-            assert expected_val == value
+    def test_heuristic_cache(self):
+        g = create_grid_graph(5, 5)
+        t = g.vertices[-1]
+        h = ManhattanDistance()
+
+        with mock.patch.object(h, "evaluate", wraps=h.evaluate) as evaluate:
+            cache = _HeuristicCache(h, t, g)
+            for v in g.vertices * 2:
+                assert cache[v] == ManhattanDistance().evaluate(v, t, g)
+            assert evaluate.call_count == len(g.vertices)
+
+            g.find_path(g.vertices[0], t, h, AlgorithmEnum.A_STAR)
+            assert evaluate.call_count <= 2 * len(g.vertices)
 
     def test_manhattan_distance_evaluate(self):
         # o - o - t - o
@@ -59,3 +69,42 @@ class TestHeuristic(unittest.TestCase):
 
         assert h.evaluate(s, t, g) is 4
 
+
+    def test_landmark_heuristic(self):
+        g: Graph = GraphFactory.digraph(40, 160, weighted=True)
+        h = LandmarkHeuristic(g, 4)
+        assert len(h.landmarks) == 4
+
+        # Lower bounds of the true distances
+        for s in g.vertices[::4]:
+            tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+            for t in g.vertices:
+                assert h.evaluate(s, t, g) <= tree.distance(t) + 1e-9
+                assert g.find_path(s, t, h, AlgorithmEnum.A_STAR).value == pytest.approx(tree.distance(t))
+
+    def test_landmark_heuristic_grid(self):
+        g: Graph = create_grid_graph(20, 20)
+        for i, e in enumerate(g.edges):
+            e.value = i * 7 % 10 + 1
+        s, t = g.vertices[0], g.vertices[-1]
+        expected: Path = g.find_path(s, t, algorithm = AlgorithmEnum.DIJKSTRA)
+
+        for selection in LandmarkSelection:
+            h = LandmarkHeuristic(g, 8, selection)
+            path: Path = g.find_path(s, t, h, AlgorithmEnum.A_STAR)
+            assert path.value == expected.value
+            assert path.settled < expected.settled
+
+    def test_landmark_heuristic_errors(self):
+        g = create_test_graph()
+        with pytest.raises(LibgraphyError):
+            LandmarkHeuristic(g, selection=LandmarkSelection.PLANAR)
+
+        h = LandmarkHeuristic(g, 2)
+        g.edges[0].value = 1
+        with pytest.raises(LibgraphyError):
+            g.find_path(g.vertices[0], g.vertices[2], h, AlgorithmEnum.A_STAR)
+
+        g.edges[0].value = -1
+        with pytest.raises(LibgraphyError):
+            LandmarkHeuristic(g)
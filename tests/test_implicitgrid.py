@@ -0,0 +1,96 @@
+import unittest
+import pytest
+from random import randrange, random
+
+from libgraphy import *
+
+class TestImplicitGridGraph(unittest.TestCase):
+    def assert_paths(self, ig: ImplicitGridGraph, algorithms: list[AlgorithmEnum], heuristic: Heuristic = Heuristic()):
+        g: Graph = ig.to_graph()
+        cells = {(v.x, v.y): v for v in g.vertices}
+
+        for s in g.vertices[::17]:
+            tree: ShortestPathTree = g.shortest_path_tree(s, AlgorithmEnum.DIJKSTRA)
+            for t in g.vertices[1::9]:
+                start, end = ig.vertex(s.x, s.y), ig.vertex(t.x, t.y)
+                for algorithm in algorithms:
+                    path: Path = ig.find_path(start, end, heuristic, algorithm)
+                    assert path.value == pytest.approx(tree.distance(cells[(t.x, t.y)]))
+                    if path.edges:
+                        assert path.edges[0].predecessor is start and path.edges[-1].successor is end
+                        assert all(a.successor is b.predecessor for a, b in zip(path.edges, path.edges[1:]))
+                        assert all(not ig.is_blocked(e.successor.x, e.successor.y) for e in path.edges)
+                        assert path.value == pytest.approx(sum(e.value for e in path.edges))
+
+    def test_cells(self):
+        ig = ImplicitGridGraph(70, 3, blocked=[(0, 0), (65, 2)])
+        assert len(ig) == 210
+        assert ig.is_blocked(65, 2) and not ig.is_blocked(64, 2)
+        assert ig.blocked_count() == 2
+        assert ig.nbytes() == 3 * 9
+
+        ig.unblock(0, 0)
+        ig.block(69, 1)
+        assert not ig.is_blocked(0, 0) and ig.is_blocked(69, 1)
+        assert ig.blocked_count() == 2
+
+        v: Vertex = ig.vertex(3, 2)
+        assert (v.x, v.y, v.name) == (3, 2, "(3,2)")
+
+        with pytest.raises(LibgraphyError):
+            ig.block(70, 0)
+        with pytest.raises(LibgraphyError):
+            ImplicitGridGraph(3, 3, costs=[1] * 8)
+        with pytest.raises(LibgraphyError):
+            ImplicitGridGraph(3, 3, diagonal_cost=3)
+
+    def test_to_graph(self):
+        ig = ImplicitGridGraph(4, 3, diagonals=False, blocked=[(1, 1)])
+        g: Graph = ig.to_graph()
+        assert len(g.vertices) == 11
+        assert len(g.edges) == 2 * (3 * 3 + 4 * 2) - 2 * 4
+
+        g = ImplicitGridGraph(4, 3).to_graph()
+        assert len(g.edges) == len(GraphFactory.square_grid(4, 3, 100).edges)
+
+    def test_uniform(self):
+        for diagonals, diagonal_cost, heuristic in [(True, 1, ChebyshevDistance()), (True, 1.5, Heuristic()), (False, 1, ManhattanDistance())]:
+            blocked = [(randrange(20), randrange(16)) for _ in range(80)]
+            ig = ImplicitGridGraph(20, 16, diagonals, diagonal_cost, blocked)
+            self.assert_paths(ig, [AlgorithmEnum.JPS, AlgorithmEnum.A_STAR, AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BEST], heuristic)
+
+    def test_costs(self):
+        costs = [1 + random() * 3 for _ in range(18 * 14)]
+        ig = ImplicitGridGraph(18, 14, costs=costs, blocked=[(randrange(18), randrange(14)) for _ in range(50)])
+        self.assert_paths(ig, [AlgorithmEnum.A_STAR, AlgorithmEnum.DIJKSTRA, AlgorithmEnum.BEST])
+
+        with pytest.raises(LibgraphyError):
+            ig.find_path(ig.vertex(0, 0), ig.vertex(5, 5), algorithm=AlgorithmEnum.JPS)
+
+    def test_jps_settled(self):
+        # Wall across the grid with a gap at the bottom
+        ig = ImplicitGridGraph(300, 200, blocked=[(150, y) for y in range(199)])
+        start, end = ig.vertex(0, 0), ig.vertex(299, 0)
+
+        path: Path = ig.find_path(start, end)
+        expected: Path = ig.find_path(start, end, ChebyshevDistance(), AlgorithmEnum.A_STAR)
+        assert path.value == expected.value == 398
+        assert path.settled < expected.settled // 100
+        assert len(path.edges) == 398
+
+    def test_blocked_endpoints(self):
+        ig = ImplicitGridGraph(5, 5, blocked=[(2, 2), (0, 1), (1, 0), (1, 1)])
+        path: Path = ig.find_path(ig.vertex(2, 2), ig.vertex(4, 4))
+        assert path.edges == [] and path.value == float("inf")
+
+        for algorithm in [AlgorithmEnum.JPS, AlgorithmEnum.A_STAR]:
+            path = ig.find_path(ig.vertex(0, 0), ig.vertex(4, 4), algorithm=algorithm)
+            assert path.edges == [] and path.value == float("inf")
+
+        path = ig.find_path(ig.vertex(3, 3), ig.vertex(3, 3))
+        assert path.edges == [] and path.value == 0
+
+        with pytest.raises(LibgraphyError):
+            ig.find_path(ig.vertex(3, 3), Vertex("u", x=5, y=0))
+        with pytest.raises(LibgraphyError):
+            ig.find_path(ig.vertex(3, 3), ig.vertex(4, 4), algorithm=AlgorithmEnum.BELLMAN_FORD)